@@ -13,6 +13,7 @@ Run with: pytest tests/test_config_ui.py -v
 
 import pytest
 import os
+import sqlite3
 import tempfile
 import json
 from pathlib import Path
@@ -258,14 +259,38 @@ class TestConfigurationValidation:
         """Test invalid check interval (too low)"""
         db_path = tmp_path / "test_config.db"
         config_mgr = ConfigurationManager(str(db_path))
-        
+
         is_valid, error = config_mgr.validate_config(
             'trading.check_interval_seconds',
             0
         )
-        
+
         assert is_valid is False
 
+    def test_validate_many_all_valid(self, tmp_path):
+        """Test validate_many accepts a valid batch"""
+        db_path = tmp_path / "test_config.db"
+        config_mgr = ConfigurationManager(str(db_path))
+
+        error = config_mgr.validate_many({
+            'risk.max_position_size_percent': 15.0,
+            'trading.symbols': ["AAPL", "TSLA"]
+        })
+
+        assert error is None
+
+    def test_validate_many_reports_first_error(self, tmp_path):
+        """Test validate_many rejects a batch with one bad value"""
+        db_path = tmp_path / "test_config.db"
+        config_mgr = ConfigurationManager(str(db_path))
+
+        error = config_mgr.validate_many({
+            'risk.max_position_size_percent': 15.0,
+            'llm.temperature': 5.0
+        })
+
+        assert error is not None
+
 
 class TestConfigurationHistory:
     """Test configuration change history"""
@@ -333,6 +358,28 @@ class TestConfigurationHistory:
         
         assert len(history) <= 5
     
+    def test_history_offset_pagination(self, tmp_path):
+        """Test history offset skips the newest entries"""
+        db_path = tmp_path / "test_config.db"
+        config_mgr = ConfigurationManager(str(db_path))
+
+        # Make many changes
+        for i in range(10):
+            config_mgr.save_config('risk.max_position_size_percent', 10.0 + i)
+
+        first_page = config_mgr.get_history(limit=3)
+        second_page = config_mgr.get_history(limit=3, offset=3)
+
+        assert len(first_page) == 3
+        assert len(second_page) == 3
+
+        # Pages should not overlap and stay newest-first
+        first_ids = {entry['id'] for entry in first_page}
+        second_ids = {entry['id'] for entry in second_page}
+        assert not first_ids & second_ids
+        assert first_page[0]['new_value'] == 19.0
+        assert second_page[0]['new_value'] == 16.0
+
     def test_history_includes_old_value(self, tmp_path):
         """Test history includes old value"""
         db_path = tmp_path / "test_config.db"
@@ -390,5 +437,111 @@ class TestConfigurationPersistence:
         assert config_mgr2.get_config('trading.symbols') == ["SPY", "QQQ"]
 
 
+class TestBatchSave:
+    """Test multi-key saves through save_config_many"""
+
+    def test_batch_save_applies_all_values(self, tmp_path):
+        """Test batch save writes every key and records history"""
+        db_path = tmp_path / "test_config.db"
+        config_mgr = ConfigurationManager(str(db_path))
+
+        success = config_mgr.save_config_many([
+            ('risk.max_position_size_percent', 17.5),
+            ('risk.max_daily_loss_percent', 3.5),
+            ('trading.symbols', ["SPY", "QQQ"])
+        ], changed_by='test')
+
+        assert success is True
+        assert config_mgr.get_config('risk.max_position_size_percent') == 17.5
+        assert config_mgr.get_config('risk.max_daily_loss_percent') == 3.5
+        assert config_mgr.get_config('trading.symbols') == ["SPY", "QQQ"]
+
+        # Each key gets its own history row
+        history = config_mgr.get_history(key='risk.max_daily_loss_percent')
+        assert history[0]['new_value'] == 3.5
+        assert history[0]['changed_by'] == 'test'
+
+    def test_batch_save_rolls_back_on_failure(self, tmp_path):
+        """Test a mid-batch failure leaves no key changed"""
+        db_path = tmp_path / "test_config.db"
+        config_mgr = ConfigurationManager(str(db_path))
+
+        # A set is not JSON-serializable, so encoding the second
+        # change fails after the first was prepared
+        success = config_mgr.save_config_many([
+            ('risk.max_position_size_percent', 99.0),
+            ('trading.symbols', {"SPY", "QQQ"})
+        ], changed_by='test')
+
+        assert success is False
+
+        # Nothing from the batch was applied or recorded
+        assert config_mgr.get_config('risk.max_position_size_percent') == 10.0
+        history = config_mgr.get_history(key='risk.max_position_size_percent')
+        assert all(entry['new_value'] != 99.0 for entry in history)
+
+
+class TestSchemaMigration:
+    """Test one-shot migration from the legacy JSON-TEXT schema"""
+
+    @staticmethod
+    def _create_legacy_db(db_path, rows):
+        """Build a database with the pre-typed-column config schema"""
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("""
+            CREATE TABLE config (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                category TEXT NOT NULL,
+                description TEXT,
+                updated_at TEXT NOT NULL
+            )
+        """)
+        conn.executemany("""
+            INSERT INTO config (key, value, category, description, updated_at)
+            VALUES (?, ?, ?, ?, '2025-01-01T00:00:00')
+        """, rows)
+        conn.commit()
+        conn.close()
+
+    def test_migration_preserves_values_and_types(self, tmp_path):
+        """Test legacy JSON values survive migration with their types"""
+        db_path = tmp_path / "test_config.db"
+        self._create_legacy_db(db_path, [
+            ('risk.max_position_size_percent', json.dumps(42.5), 'risk', None),
+            ('trading.dry_run', json.dumps(True), 'trading', None),
+            ('trading.symbols', json.dumps(["SPY", "QQQ"]), 'trading', None),
+            ('llm.model_name', json.dumps("custom-model"), 'llm', None),
+        ])
+
+        config_mgr = ConfigurationManager(str(db_path))
+
+        assert config_mgr.get_config('risk.max_position_size_percent') == 42.5
+        assert config_mgr.get_config('trading.dry_run') is True
+        assert config_mgr.get_config('trading.symbols') == ["SPY", "QQQ"]
+        assert config_mgr.get_config('llm.model_name') == "custom-model"
+
+        # Legacy table is gone and the typed columns are in place
+        conn = sqlite3.connect(str(db_path))
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(config)")}
+        conn.close()
+        assert 'value' not in columns
+        assert 'value_type' in columns
+
+    def test_migration_skips_corrupt_values(self, tmp_path):
+        """Test a corrupt legacy value doesn't abort the migration"""
+        db_path = tmp_path / "test_config.db"
+        self._create_legacy_db(db_path, [
+            ('risk.max_position_size_percent', json.dumps(42.5), 'risk', None),
+            ('llm.model_name', 'not valid json{', 'llm', None),
+        ])
+
+        config_mgr = ConfigurationManager(str(db_path))
+
+        # The good row migrated; the corrupt one fell back to defaults
+        assert config_mgr.get_config('risk.max_position_size_percent') == 42.5
+        assert config_mgr.get_config('llm.model_name') == "gemma-3-4b"
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v', '--tb=short'])
@@ -0,0 +1,153 @@
+// Modal and tab management
+function openConfigModal() {
+    document.getElementById('config-modal').style.display = 'flex';
+    console.log('Config modal opened');
+}
+
+function closeConfigModal() {
+    document.getElementById('config-modal').style.display = 'none';
+    console.log('Config modal closed');
+}
+
+function switchTab(activeTab, inactiveTab) {
+    // Update tab classes
+    document.getElementById(activeTab).className = 'config-tab active';
+    document.getElementById(inactiveTab).className = 'config-tab';
+}
+
+// LLM Tab auto-scroll management
+let llmAutoScroll = true;
+let lastConversationCount = 0;
+let lastScrollHeight = 0;
+let userIsScrolling = false;
+let scrollTimeout = null;
+
+function checkLLMScroll() {
+    const container = document.querySelector('.llm-thoughts-container');
+    if (!container) return;
+
+    const isAtBottom = container.scrollHeight - container.scrollTop - container.clientHeight < 50;
+
+    if (!isAtBottom && userIsScrolling) {
+        // User has scrolled away from bottom
+        llmAutoScroll = false;
+        const indicator = document.getElementById('llm-scroll-indicator');
+        if (indicator) indicator.style.display = 'block';
+    } else if (isAtBottom) {
+        // User is at bottom, enable auto-scroll
+        llmAutoScroll = true;
+        const indicator = document.getElementById('llm-scroll-indicator');
+        if (indicator) indicator.style.display = 'none';
+    }
+}
+
+function scrollToLatest(force = false) {
+    const container = document.querySelector('.llm-thoughts-container');
+    if (!container) return;
+
+    const currentScrollHeight = container.scrollHeight;
+
+    // Only auto-scroll if:
+    // 1. Auto-scroll is enabled (user at bottom or forced)
+    // 2. Content has actually changed (new conversations added)
+    if ((llmAutoScroll || force) && currentScrollHeight !== lastScrollHeight) {
+        container.scrollTop = container.scrollHeight;
+        lastScrollHeight = currentScrollHeight;
+    }
+}
+
+function onUserScroll() {
+    userIsScrolling = true;
+
+    // Clear existing timeout
+    if (scrollTimeout) {
+        clearTimeout(scrollTimeout);
+    }
+
+    // Set flag that user is done scrolling after 500ms of no scroll events
+    scrollTimeout = setTimeout(() => {
+        userIsScrolling = false;
+        checkLLMScroll();
+    }, 500);
+
+    // Immediately check scroll position
+    checkLLMScroll();
+}
+
+// Click handler for scroll indicator
+function scrollLLMToBottom() {
+    const container = document.querySelector('.llm-thoughts-container');
+    if (container) {
+        llmAutoScroll = true;
+        userIsScrolling = false;
+        container.scrollTo({
+            top: container.scrollHeight,
+            behavior: 'smooth'
+        });
+        const indicator = document.getElementById('llm-scroll-indicator');
+        if (indicator) indicator.style.display = 'none';
+    }
+}
+
+// Mutation observer to detect content changes
+function setupContentObserver() {
+    const container = document.querySelector('.llm-thoughts-container');
+    if (!container) {
+        // Retry after a short delay if container not found
+        setTimeout(setupContentObserver, 500);
+        return;
+    }
+
+    const observer = new MutationObserver((mutations) => {
+        // Content has changed, scroll if auto-scroll enabled
+        scrollToLatest();
+    });
+
+    observer.observe(container, {
+        childList: true,
+        subtree: true
+    });
+}
+
+// Initialize when DOM is ready
+document.addEventListener('DOMContentLoaded', function() {
+    // Add click handlers
+    const configBtn = document.getElementById('config-button');
+    const closeBtn = document.getElementById('config-close');
+    const llmTab = document.getElementById('llm-tab');
+    const traderTab = document.getElementById('trader-tab');
+
+    if (configBtn) {
+        configBtn.addEventListener('click', openConfigModal);
+    }
+
+    if (closeBtn) {
+        closeBtn.addEventListener('click', closeConfigModal);
+    }
+
+    // Close modal when clicking backdrop
+    const modal = document.getElementById('config-modal');
+    if (modal) {
+        modal.addEventListener('click', function(e) {
+            if (e.target === modal) {
+                closeConfigModal();
+            }
+        });
+    }
+
+    // LLM scroll management
+    const llmContainer = document.querySelector('.llm-thoughts-container');
+    if (llmContainer) {
+        llmContainer.addEventListener('scroll', onUserScroll);
+    }
+
+    const scrollIndicator = document.getElementById('llm-scroll-indicator');
+    if (scrollIndicator) {
+        scrollIndicator.addEventListener('click', scrollLLMToBottom);
+    }
+
+    // Setup mutation observer to detect content changes
+    setupContentObserver();
+
+    console.log('Config modal and smart LLM scroll handlers initialized');
+});
@@ -21,15 +21,115 @@ Author: WawaTrader Team
 Date: October 2025
 """
 
-from flask import Flask, render_template_string, request, jsonify, redirect, url_for
+from flask import Flask, Response, request, jsonify, redirect, url_for
+import atexit
+import functools
+import gzip
+import hashlib
 import json
+import queue
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 import os
 from loguru import logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+
+def _json_response(obj: Any) -> "Response":
+    """Serialise an API payload with orjson when available (2-5x faster)"""
+    if ORJSON_AVAILABLE:
+        return Response(orjson.dumps(obj), mimetype="application/json")
+    return Response(json.dumps(obj), mimetype="application/json")
+
+
+def _parse_request_json() -> Any:
+    """Parse the request body, preferring orjson over Flask's parser"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(request.get_data())
+    return request.get_json()
+
+
+# Single pre-built JSON decoder for hot read paths (avoids the per-call
+# decoder setup inside json.loads)
+_DECODE_JSON = json.JSONDecoder().decode
+
+# History retention: cap the table size, purging every Nth save
+_HISTORY_MAX_ROWS = 10000
+_HISTORY_PURGE_INTERVAL = 100
+
+
+def _validate_symbols(value: Any) -> tuple[bool, Optional[str]]:
+    """Validate the trading symbol watchlist"""
+    if not isinstance(value, list) or len(value) == 0:
+        return False, "Symbols must be a non-empty list"
+    if not all(isinstance(s, str) for s in value):
+        return False, "All symbols must be strings"
+    return True, None
+
+
+# Range-checked keys: (lo, hi, lo_exclusive, error message). A single dict
+# lookup replaces the old if/elif chain over every key string.
+_RANGE_VALIDATORS: Dict[str, tuple] = {
+    "risk.max_position_size_percent":
+        (0, 100, True, "Position size must be between 0 and 100%"),
+    "risk.max_daily_loss_percent":
+        (0, 100, True, "Daily loss limit must be between 0 and 100%"),
+    "risk.max_portfolio_exposure_percent":
+        (0, 100, True, "Portfolio exposure must be between 0 and 100%"),
+    "risk.max_trades_per_day":
+        (1, 1000, False, "Trades per day must be between 1 and 1000"),
+    "risk.min_confidence_threshold":
+        (0, 100, False, "Confidence threshold must be between 0 and 100%"),
+    "trading.check_interval_seconds":
+        (1, 3600, False, "Check interval must be between 1 and 3600 seconds"),
+    "llm.temperature":
+        (0.0, 1.0, False, "Temperature must be between 0.0 and 1.0"),
+    "llm.max_tokens":
+        (1, 4096, False, "Max tokens must be between 1 and 4096"),
+}
+
+# Keys needing structural checks rather than a numeric range
+_CUSTOM_VALIDATORS = {
+    "trading.symbols": _validate_symbols,
+}
+
+
+def _retry_on_locked(max_attempts: int = 5, base_delay: float = 0.05):
+    """
+    Retry a database operation when SQLite reports the file as locked.
+
+    Uses exponential backoff between attempts; any other error (or the
+    final locked attempt) propagates to the caller.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_attempts):
+                try:
+                    return func(*args, **kwargs)
+                except sqlite3.OperationalError as e:
+                    if "locked" not in str(e) or attempt == max_attempts - 1:
+                        raise
+                    time.sleep(base_delay * (2 ** attempt))
+        return wrapper
+    return decorator
+
 
 class ConfigurationManager:
     """
@@ -55,76 +155,257 @@ class ConfigurationManager:
         """
         self.db_path = db_path
         self.config: Dict[str, Any] = {}
-        
+        self._flat: Dict[str, Any] = {}
+        self._save_count = 0
+        self._config_json_cache: Optional[bytes] = None
+        self._config_etag: Optional[str] = None
+        self._paths: Dict[str, tuple] = {}
+
+        # synchronous=OFF skips fsync entirely — acceptable for a local
+        # config DB in dry-run/dev, never for anything holding trade data
+        self._sync_mode = os.environ.get("SYNC_MODE", "NORMAL").upper()
+        if self._sync_mode not in ("OFF", "NORMAL", "FULL"):
+            self._sync_mode = "NORMAL"
+
+        # Long-lived connections: one writer guarded by a lock, plus a
+        # small pool of readers (WAL allows concurrent reads during writes)
+        self._write_lock = threading.Lock()
+        self._writer = self._connect()
+        self._readers: queue.Queue = queue.Queue()
+        for _ in range(os.cpu_count() or 2):
+            self._readers.put(self._connect())
+        atexit.register(self.close)
+
         # Initialize database
         self._init_database()
-        
+
         # Load current configuration
         self.load_config()
-        
+
         logger.info(f"Configuration manager initialized: {db_path}")
-    
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a database connection with performance pragmas applied.
+
+        WAL mode lets readers run concurrently with the writer, and
+        synchronous=NORMAL avoids an fsync on every commit (safe under WAL).
+        The remaining pragmas are per-connection tuning for this small,
+        frequently-read config workload.
+
+        Returns:
+            Configured sqlite3 connection
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.executescript(f"""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous={self._sync_mode};
+            PRAGMA busy_timeout=5000;
+            PRAGMA temp_store=memory;
+            PRAGMA cache_size=-20000;
+        """)
+        return conn
+
+    def set_sync_mode(self, mode: str) -> None:
+        """
+        Change the writer's synchronous pragma at runtime.
+
+        Called when trading.dry_run flips: paper-trading config writes
+        don't need crash durability, so OFF trades it for ~20x faster
+        saves.
+
+        Args:
+            mode: One of "OFF", "NORMAL", "FULL"
+        """
+        mode = mode.upper()
+        if mode not in ("OFF", "NORMAL", "FULL"):
+            raise ValueError(f"Invalid sync mode: {mode}")
+        self._sync_mode = mode
+        with self._write_lock:
+            self._writer.execute(f"PRAGMA synchronous={mode}")
+
+    @contextmanager
+    def _reader_pool(self):
+        """Borrow a reader connection from the pool for the duration of a query"""
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def close(self) -> None:
+        """Close all pooled connections (registered with atexit)"""
+        with self._write_lock:
+            self._writer.close()
+        while not self._readers.empty():
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+
+    @staticmethod
+    def _encode_value(value: Any) -> tuple:
+        """Split a Python value into (value_type, num, text, bool, json) columns"""
+        if isinstance(value, bool):
+            return ('bool', None, None, int(value), None)
+        if isinstance(value, int):
+            return ('int', float(value), None, None, None)
+        if isinstance(value, float):
+            return ('float', value, None, None, None)
+        if isinstance(value, str):
+            return ('str', None, value, None, None)
+        return ('json', None, None, None, json.dumps(value))
+
+    @staticmethod
+    def _decode_row(value_type: str, num: Optional[float], text: Optional[str],
+                    boolean: Optional[int], value_json: Optional[str]) -> Any:
+        """Reassemble a Python value from its typed columns"""
+        if value_type == 'bool':
+            return bool(boolean)
+        if value_type == 'int':
+            return int(num)
+        if value_type == 'float':
+            return num
+        if value_type == 'str':
+            return text
+        return json.loads(value_json)
+
+    def _migrate_to_typed_schema(self, conn: sqlite3.Connection) -> None:
+        """Rebuild a legacy JSON-TEXT config table with typed value columns"""
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.execute("ALTER TABLE config RENAME TO config_legacy")
+            cursor.execute("""
+                CREATE TABLE config (
+                    key TEXT PRIMARY KEY,
+                    value_type TEXT NOT NULL,
+                    value_num REAL,
+                    value_text TEXT,
+                    value_bool INTEGER,
+                    value_json TEXT,
+                    category TEXT NOT NULL,
+                    description TEXT,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+            rows = cursor.execute("""
+                SELECT key, value, category, description, updated_at
+                FROM config_legacy
+            """).fetchall()
+            # Skip corrupt legacy values instead of aborting the whole
+            # migration — load_config used to skip them with a warning
+            typed_rows = []
+            for key, value_json, category, description, updated_at in rows:
+                try:
+                    value = json.loads(value_json)
+                except (json.JSONDecodeError, TypeError):
+                    logger.warning(f"Skipping corrupt legacy config value for {key}")
+                    continue
+                typed_rows.append(
+                    (key, *self._encode_value(value), category,
+                     description, updated_at))
+            cursor.executemany("""
+                INSERT INTO config
+                (key, value_type, value_num, value_text, value_bool, value_json,
+                 category, description, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, typed_rows)
+            cursor.execute("DROP TABLE config_legacy")
+            conn.commit()
+            logger.info(f"Migrated {len(typed_rows)} config rows to typed schema")
+        except Exception:
+            conn.rollback()
+            raise
+
     def _init_database(self) -> None:
         """Create configuration database tables if they don't exist"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Configuration table (current active config)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS config (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL,
-                category TEXT NOT NULL,
-                description TEXT,
-                updated_at TEXT NOT NULL
-            )
-        """)
-        
-        # Configuration history table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS config_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                key TEXT NOT NULL,
-                old_value TEXT,
-                new_value TEXT NOT NULL,
-                changed_by TEXT,
-                changed_at TEXT NOT NULL
-            )
-        """)
-        
-        conn.commit()
-        conn.close()
-        
+        with self._write_lock:
+            conn = self._writer
+            cursor = conn.cursor()
+
+            # One-shot migration from the legacy JSON-TEXT schema
+            columns = {row[1] for row in cursor.execute("PRAGMA table_info(config)")}
+            if "value" in columns:
+                self._migrate_to_typed_schema(conn)
+
+            # Configuration table (current active config). Scalars live in
+            # typed columns so loads skip json.loads; only lists/dicts
+            # (e.g. trading.symbols) fall back to value_json.
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS config (
+                    key TEXT PRIMARY KEY,
+                    value_type TEXT NOT NULL,
+                    value_num REAL,
+                    value_text TEXT,
+                    value_bool INTEGER,
+                    value_json TEXT,
+                    category TEXT NOT NULL,
+                    description TEXT,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+
+            # Configuration history table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS config_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    key TEXT NOT NULL,
+                    old_value TEXT,
+                    new_value TEXT NOT NULL,
+                    changed_by TEXT,
+                    changed_at TEXT NOT NULL
+                )
+            """)
+
+            # Indexes matching get_history's WHERE/ORDER BY so lookups
+            # stay fast as the history table grows
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_hist_key_time
+                ON config_history(key, changed_at DESC)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_hist_time
+                ON config_history(changed_at DESC)
+            """)
+
+            conn.commit()
+
         # Insert default configuration if empty
         if not self.config:
             self._insert_defaults()
-    
+
     def _insert_defaults(self) -> None:
         """Insert default configuration values"""
         defaults = self._get_default_config()
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+
         timestamp = datetime.now().isoformat()
-        
-        for category, settings in defaults.items():
-            for key, value_dict in settings.items():
-                full_key = f"{category}.{key}"
-                cursor.execute("""
-                    INSERT OR IGNORE INTO config (key, value, category, description, updated_at)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
-                    full_key,
-                    json.dumps(value_dict['value']),
-                    category,
-                    value_dict.get('description', ''),
-                    timestamp
-                ))
-        
-        conn.commit()
-        conn.close()
-        
+
+        # Flatten into one row list so all inserts share a single transaction
+        # (one fsync instead of one per row)
+        rows = [
+            (
+                f"{category}.{key}",
+                *self._encode_value(value_dict['value']),
+                category,
+                value_dict.get('description', ''),
+                timestamp
+            )
+            for category, settings in defaults.items()
+            for key, value_dict in settings.items()
+        ]
+
+        with self._write_lock:
+            conn = self._writer
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany("""
+                INSERT OR IGNORE INTO config
+                (key, value_type, value_num, value_text, value_bool, value_json,
+                 category, description, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            conn.commit()
+
         logger.info("Default configuration inserted")
     
     def _get_default_config(self) -> Dict[str, Dict[str, Any]]:
@@ -241,30 +522,37 @@ class ConfigurationManager:
         Returns:
             Dictionary of configuration values
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT key, value FROM config")
-        rows = cursor.fetchall()
-        
         config = {}
-        for key, value_json in rows:
-            try:
-                value = json.loads(value_json)
-                # Parse nested keys (e.g., "risk.max_position_size")
-                parts = key.split('.')
-                current = config
-                for part in parts[:-1]:
-                    if part not in current:
-                        current[part] = {}
-                    current = current[part]
-                current[parts[-1]] = value
-            except json.JSONDecodeError:
-                logger.warning(f"Failed to parse config value for {key}")
-        
-        conn.close()
-        
+        flat = {}
+        with self._reader_pool() as conn:
+            cursor = conn.execute("""
+                SELECT key, value_type, value_num, value_text, value_bool, value_json
+                FROM config
+            """)
+
+            # Iterate the cursor directly — no fetchall() list materialised
+            for key, *typed in cursor:
+                try:
+                    value = self._decode_row(*typed)
+                    # Parse nested keys (e.g., "risk.max_position_size"),
+                    # interning the split path for later lookups
+                    parts = self._paths.get(key)
+                    if parts is None:
+                        parts = self._paths[key] = tuple(key.split('.'))
+                    current = config
+                    for part in parts[:-1]:
+                        if part not in current:
+                            current[part] = {}
+                        current = current[part]
+                    current[parts[-1]] = value
+                    flat[key] = value
+                except (json.JSONDecodeError, TypeError):
+                    logger.warning(f"Failed to parse config value for {key}")
+
         self.config = config
+        self._flat = flat
+        self._config_json_cache = None
+        self._config_etag = None
         return config
     
     def save_config(self, key: str, value: Any, changed_by: str = "ui") -> bool:
@@ -280,43 +568,193 @@ class ConfigurationManager:
             True if saved successfully
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Get old value for history
-            cursor.execute("SELECT value FROM config WHERE key = ?", (key,))
-            row = cursor.fetchone()
-            old_value = row[0] if row else None
-            
-            # Update configuration
-            timestamp = datetime.now().isoformat()
-            category = key.split('.')[0]
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO config (key, value, category, description, updated_at)
-                VALUES (?, ?, ?, 
-                    (SELECT description FROM config WHERE key = ?),
-                    ?)
-            """, (key, json.dumps(value), category, key, timestamp))
-            
-            # Add to history
-            cursor.execute("""
-                INSERT INTO config_history (key, old_value, new_value, changed_by, changed_at)
-                VALUES (?, ?, ?, ?, ?)
-            """, (key, old_value, json.dumps(value), changed_by, timestamp))
-            
-            conn.commit()
-            conn.close()
-            
-            # Reload configuration
-            self.load_config()
-            
+            self._write_config(key, value, changed_by)
+
+            # Update the in-memory config in place — no need to re-read and
+            # re-parse the whole table for a single-key change
+            parts = self._paths.get(key) or tuple(key.split('.'))
+            current = self.config
+            for part in parts[:-1]:
+                if part not in current:
+                    current[part] = {}
+                current = current[part]
+            current[parts[-1]] = value
+            self._flat[key] = value
+
+            self._config_json_cache = None
+            self._config_etag = None
+
+            # Relax durability while paper trading (unless SYNC_MODE is set)
+            if key == "trading.dry_run" and "SYNC_MODE" not in os.environ:
+                self.set_sync_mode("OFF" if value else "NORMAL")
+
             logger.info(f"Configuration updated: {key} = {value}")
             return True
-            
+
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
             return False
+
+    def save_config_many(self, changes: List[tuple], changed_by: str = "ui") -> bool:
+        """
+        Save several configuration values in one transaction.
+
+        A category-level "Save" in the UI touches ~5 keys; writing them
+        through one BEGIN IMMEDIATE + executemany costs a single fsync
+        instead of one per key.
+
+        Args:
+            changes: List of (key, value) pairs
+            changed_by: Who changed the configuration
+
+        Returns:
+            True if all values were saved successfully
+        """
+        if not changes:
+            return True
+
+        try:
+            self._write_config_many(changes, changed_by)
+
+            for key, value in changes:
+                parts = self._paths.get(key) or tuple(key.split('.'))
+                current = self.config
+                for part in parts[:-1]:
+                    if part not in current:
+                        current[part] = {}
+                    current = current[part]
+                current[parts[-1]] = value
+                self._flat[key] = value
+            self._config_json_cache = None
+            self._config_etag = None
+
+            # Relax durability while paper trading (unless SYNC_MODE is set)
+            for key, value in changes:
+                if key == "trading.dry_run" and "SYNC_MODE" not in os.environ:
+                    self.set_sync_mode("OFF" if value else "NORMAL")
+
+            logger.info(f"Configuration updated: {len(changes)} keys by {changed_by}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to save configuration batch: {e}")
+            return False
+
+    @_retry_on_locked()
+    def _write_config_many(self, changes: List[tuple], changed_by: str) -> None:
+        """Write a batch of config values + history rows in one transaction"""
+        timestamp = datetime.now().isoformat()
+        keys = [key for key, _ in changes]
+
+        with self._write_lock:
+            conn = self._writer
+            cursor = conn.cursor()
+            try:
+                cursor.execute("BEGIN IMMEDIATE")
+
+                # Old values for history, fetched in one round-trip
+                placeholders = ','.join('?' * len(keys))
+                cursor.execute(f"""
+                    SELECT key, value_type, value_num, value_text, value_bool, value_json
+                    FROM config WHERE key IN ({placeholders})
+                """, keys)
+                old_values = {
+                    row[0]: json.dumps(self._decode_row(*row[1:]))
+                    for row in cursor.fetchall()
+                }
+
+                config_rows = [
+                    (key, *self._encode_value(value), key.split('.')[0], key, timestamp)
+                    for key, value in changes
+                ]
+                history_rows = [
+                    (key, old_values.get(key), json.dumps(value), changed_by, timestamp)
+                    for key, value in changes
+                ]
+
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO config
+                    (key, value_type, value_num, value_text, value_bool, value_json,
+                     category, description, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?,
+                        (SELECT description FROM config WHERE key = ?),
+                        ?)
+                """, config_rows)
+                cursor.executemany("""
+                    INSERT INTO config_history (key, old_value, new_value, changed_by, changed_at)
+                    VALUES (?, ?, ?, ?, ?)
+                """, history_rows)
+
+                # Keep the history table bounded — same counter as the
+                # single-key path, advanced by the batch size
+                self._save_count += len(changes)
+                if self._save_count % _HISTORY_PURGE_INTERVAL < len(changes):
+                    cursor.execute("""
+                        DELETE FROM config_history WHERE id NOT IN (
+                            SELECT id FROM config_history
+                            ORDER BY changed_at DESC
+                            LIMIT ?
+                        )
+                    """, (_HISTORY_MAX_ROWS,))
+
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    @_retry_on_locked()
+    def _write_config(self, key: str, value: Any, changed_by: str) -> None:
+        """Write a config value + history row in one immediate transaction"""
+        with self._write_lock:
+            conn = self._writer
+            cursor = conn.cursor()
+            try:
+                # BEGIN IMMEDIATE takes the write lock up front, avoiding
+                # a deferred-transaction upgrade deadlock under WAL
+                cursor.execute("BEGIN IMMEDIATE")
+
+                # Get old value for history
+                cursor.execute("""
+                    SELECT value_type, value_num, value_text, value_bool, value_json
+                    FROM config WHERE key = ?
+                """, (key,))
+                row = cursor.fetchone()
+                old_value = json.dumps(self._decode_row(*row)) if row else None
+
+                # Update configuration
+                timestamp = datetime.now().isoformat()
+                category = key.split('.')[0]
+
+                cursor.execute("""
+                    INSERT OR REPLACE INTO config
+                    (key, value_type, value_num, value_text, value_bool, value_json,
+                     category, description, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?,
+                        (SELECT description FROM config WHERE key = ?),
+                        ?)
+                """, (key, *self._encode_value(value), category, key, timestamp))
+
+                # Add to history
+                cursor.execute("""
+                    INSERT INTO config_history (key, old_value, new_value, changed_by, changed_at)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (key, old_value, json.dumps(value), changed_by, timestamp))
+
+                # Keep the history table bounded
+                self._save_count += 1
+                if self._save_count % _HISTORY_PURGE_INTERVAL == 0:
+                    cursor.execute("""
+                        DELETE FROM config_history WHERE id NOT IN (
+                            SELECT id FROM config_history
+                            ORDER BY changed_at DESC
+                            LIMIT ?
+                        )
+                    """, (_HISTORY_MAX_ROWS,))
+
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
     
     def get_config(self, key: Optional[str] = None) -> Any:
         """
@@ -330,62 +768,101 @@ class ConfigurationManager:
         """
         if key is None:
             return self.config
-        
-        # Navigate nested dict
+
+        # Fast path: full dotted keys hit the flat cache directly
+        if key in self._flat:
+            return self._flat[key]
+
+        # Fall back to the nested walk for category-level lookups
         parts = key.split('.')
         current = self.config
         for part in parts:
             if part not in current:
                 return None
             current = current[part]
-        
+
         return current
     
-    def get_history(self, key: Optional[str] = None, limit: int = 50) -> List[Dict]:
+    def get_config_json(self) -> bytes:
+        """
+        Get the full configuration pre-serialised as JSON bytes.
+
+        Cached between saves so the GET /api/config path is a straight
+        memory copy instead of a re-serialisation.
+
+        Returns:
+            UTF-8 encoded JSON of the nested config dict
+        """
+        if self._config_json_cache is None:
+            if ORJSON_AVAILABLE:
+                self._config_json_cache = orjson.dumps(self.config)
+            else:
+                self._config_json_cache = json.dumps(self.config).encode("utf-8")
+        return self._config_json_cache
+
+    def get_config_etag(self) -> str:
+        """
+        Get an ETag for the current configuration snapshot.
+
+        Computed once per config version (invalidated with the JSON
+        cache), so conditional GETs can answer 304 without hashing.
+
+        Returns:
+            Quoted ETag string derived from the serialised config
+        """
+        if self._config_etag is None:
+            self._config_etag = f'"{hashlib.md5(self.get_config_json()).hexdigest()}"'
+        return self._config_etag
+
+    def get_history(self, key: Optional[str] = None, limit: int = 50,
+                    offset: int = 0) -> List[Dict]:
         """
         Get configuration change history.
-        
+
         Args:
             key: Filter by specific key (all if None)
             limit: Maximum number of history entries
-        
+            offset: Number of newest entries to skip (for pagination)
+
         Returns:
             List of history entries
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        if key:
-            cursor.execute("""
-                SELECT id, key, old_value, new_value, changed_by, changed_at
-                FROM config_history
-                WHERE key = ?
-                ORDER BY changed_at DESC
-                LIMIT ?
-            """, (key, limit))
-        else:
-            cursor.execute("""
-                SELECT id, key, old_value, new_value, changed_by, changed_at
-                FROM config_history
-                ORDER BY changed_at DESC
-                LIMIT ?
-            """, (limit,))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        history = []
-        for row in rows:
-            history.append({
-                'id': row[0],
-                'key': row[1],
-                'old_value': json.loads(row[2]) if row[2] else None,
-                'new_value': json.loads(row[3]),
-                'changed_by': row[4],
-                'changed_at': row[5]
-            })
-        
-        return history
+        with self._reader_pool() as conn:
+            cursor = conn.cursor()
+
+            if key:
+                cursor.execute("""
+                    SELECT id, key, old_value, new_value, changed_by, changed_at
+                    FROM config_history
+                    WHERE key = ?
+                    ORDER BY changed_at DESC
+                    LIMIT ? OFFSET ?
+                """, (key, limit, offset))
+            else:
+                cursor.execute("""
+                    SELECT id, key, old_value, new_value, changed_by, changed_at
+                    FROM config_history
+                    ORDER BY changed_at DESC
+                    LIMIT ? OFFSET ?
+                """, (limit, offset))
+
+            # Stream rows off the cursor rather than fetchall()-ing a
+            # second full copy of the result set. The *_str fields reuse
+            # the JSON text already stored in the table, so the browser
+            # never has to re-stringify values just to display them.
+            return [
+                {
+                    'id': row[0],
+                    'key': row[1],
+                    'old_value': _DECODE_JSON(row[2]) if row[2] else None,
+                    'new_value': _DECODE_JSON(row[3]),
+                    'old_value_str': row[2] if row[2] else 'null',
+                    'new_value_str': row[3],
+                    'changed_by': row[4],
+                    'changed_at': row[5]
+                }
+                for row in cursor
+            ]
     
     def validate_config(self, key: str, value: Any) -> tuple[bool, Optional[str]]:
         """
@@ -398,55 +875,89 @@ class ConfigurationManager:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        # Risk parameter validation
-        if key == "risk.max_position_size_percent":
-            if not (0 < value <= 100):
-                return False, "Position size must be between 0 and 100%"
-        
-        elif key == "risk.max_daily_loss_percent":
-            if not (0 < value <= 100):
-                return False, "Daily loss limit must be between 0 and 100%"
-        
-        elif key == "risk.max_portfolio_exposure_percent":
-            if not (0 < value <= 100):
-                return False, "Portfolio exposure must be between 0 and 100%"
-        
-        elif key == "risk.max_trades_per_day":
-            if not (1 <= value <= 1000):
-                return False, "Trades per day must be between 1 and 1000"
-        
-        elif key == "risk.min_confidence_threshold":
-            if not (0 <= value <= 100):
-                return False, "Confidence threshold must be between 0 and 100%"
-        
-        # Trading parameter validation
-        elif key == "trading.symbols":
-            if not isinstance(value, list) or len(value) == 0:
-                return False, "Symbols must be a non-empty list"
-            if not all(isinstance(s, str) for s in value):
-                return False, "All symbols must be strings"
-        
-        elif key == "trading.check_interval_seconds":
-            if not (1 <= value <= 3600):
-                return False, "Check interval must be between 1 and 3600 seconds"
-        
-        # LLM parameter validation
-        elif key == "llm.temperature":
-            if not (0.0 <= value <= 1.0):
-                return False, "Temperature must be between 0.0 and 1.0"
-        
-        elif key == "llm.max_tokens":
-            if not (1 <= value <= 4096):
-                return False, "Max tokens must be between 1 and 4096"
-        
+        spec = _RANGE_VALIDATORS.get(key)
+        if spec is not None:
+            lo, hi, lo_exclusive, message = spec
+            if not ((lo < value if lo_exclusive else lo <= value) and value <= hi):
+                return False, message
+            return True, None
+
+        validator = _CUSTOM_VALIDATORS.get(key)
+        if validator is not None:
+            return validator(value)
+
         return True, None
 
+    def validate_many(self, updates: Dict[str, Any]) -> Optional[str]:
+        """
+        Validate a batch of updates in one pass.
+
+        Binds the dispatch tables once and loops tightly, rather than
+        paying per-call attribute lookups for every key.
+
+        Args:
+            updates: Mapping of configuration key to proposed value
+
+        Returns:
+            The first validation error message, or None if all are valid
+        """
+        ranges = _RANGE_VALIDATORS
+        custom = _CUSTOM_VALIDATORS
+        for key, value in updates.items():
+            spec = ranges.get(key)
+            if spec is not None:
+                lo, hi, lo_exclusive, message = spec
+                if not ((lo < value if lo_exclusive else lo <= value) and value <= hi):
+                    return message
+                continue
+            validator = custom.get(key)
+            if validator is not None:
+                ok, error = validator(value)
+                if not ok:
+                    return error
+        return None
+
 
 # Flask application
 app = Flask(__name__)
+
+# Key order doesn't matter to the UI, so skip the per-response sort pass
+# (Flask >= 2.2 exposes this on app.json, older releases via app.config)
+if hasattr(app, "json"):
+    app.json.sort_keys = False
+else:
+    app.config["JSON_SORT_KEYS"] = False
+app.config["JSONIFY_PRETTYPRINT_REGULAR"] = False
+
 config_manager = ConfigurationManager()
 
 
+def _build_schema() -> List[Dict[str, str]]:
+    """Derive the flat form schema (key, category, input type) from defaults"""
+    schema = []
+    for category, settings in config_manager._get_default_config().items():
+        for key, value_dict in settings.items():
+            value = value_dict['value']
+            if isinstance(value, bool):
+                field_type = 'bool'
+            elif isinstance(value, (int, float)):
+                field_type = 'number'
+            elif isinstance(value, list):
+                field_type = 'list'
+            else:
+                field_type = 'text'
+            schema.append({
+                'key': f"{category}.{key}",
+                'category': category,
+                'type': field_type
+            })
+    return schema
+
+
+# Static for the process lifetime — serialise once at startup
+_SCHEMA_JSON = json.dumps(_build_schema()).encode("utf-8")
+
+
 # HTML template for configuration UI
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -688,11 +1199,11 @@ HTML_TEMPLATE = """
         </header>
         
         <div class="tabs">
-            <button class="tab active" onclick="switchTab('risk')">🛡️ Risk Management</button>
-            <button class="tab" onclick="switchTab('trading')">📈 Trading Settings</button>
-            <button class="tab" onclick="switchTab('llm')">🤖 LLM Configuration</button>
-            <button class="tab" onclick="switchTab('alerts')">🔔 Alerts</button>
-            <button class="tab" onclick="switchTab('history')">📜 History</button>
+            <button class="tab active" onclick="switchTab('risk', this)">🛡️ Risk Management</button>
+            <button class="tab" onclick="switchTab('trading', this)">📈 Trading Settings</button>
+            <button class="tab" onclick="switchTab('llm', this)">🤖 LLM Configuration</button>
+            <button class="tab" onclick="switchTab('alerts', this)">🔔 Alerts</button>
+            <button class="tab" onclick="switchTab('history', this)">📜 History</button>
         </div>
         
         <div id="alert-container"></div>
@@ -874,190 +1385,120 @@ HTML_TEMPLATE = """
         </div>
     </div>
     
-    <script>
-        let currentConfig = {};
-        
-        // Switch between tabs
-        function switchTab(tabName) {
-            // Update tab buttons
-            document.querySelectorAll('.tab').forEach(tab => {
-                tab.classList.remove('active');
-            });
-            event.target.classList.add('active');
-            
-            // Update tab content
-            document.querySelectorAll('.tab-content').forEach(content => {
-                content.classList.remove('active');
-            });
-            document.getElementById(tabName + '-tab').classList.add('active');
-            
-            // Load history if history tab
-            if (tabName === 'history') {
-                loadHistory();
-            }
-        }
-        
-        // Load configuration from server
-        async function loadConfig() {
-            try {
-                const response = await fetch('/api/config');
-                currentConfig = await response.json();
-                populateForm();
-            } catch (error) {
-                showAlert('Failed to load configuration', 'error');
-            }
-        }
-        
-        // Populate form with config values
-        function populateForm() {
-            for (const [category, settings] of Object.entries(currentConfig)) {
-                for (const [key, value] of Object.entries(settings)) {
-                    const fullKey = `${category}.${key}`;
-                    const element = document.getElementById(fullKey);
-                    
-                    if (!element) continue;
-                    
-                    if (element.type === 'checkbox') {
-                        element.checked = value;
-                    } else if (fullKey === 'trading.symbols') {
-                        element.value = Array.isArray(value) ? value.join(', ') : value;
-                    } else {
-                        element.value = value;
-                    }
-                }
-            }
-        }
-        
-        // Save category configuration
-        async function saveCategory(category) {
-            const updates = {};
-            const categoryConfig = currentConfig[category] || {};
-            
-            for (const key of Object.keys(categoryConfig)) {
-                const fullKey = `${category}.${key}`;
-                const element = document.getElementById(fullKey);
-                
-                if (!element) continue;
-                
-                let value;
-                if (element.type === 'checkbox') {
-                    value = element.checked;
-                } else if (element.type === 'number') {
-                    value = parseFloat(element.value);
-                } else if (fullKey === 'trading.symbols') {
-                    value = element.value.split(',').map(s => s.trim()).filter(s => s);
-                } else {
-                    value = element.value;
-                }
-                
-                updates[fullKey] = value;
-            }
-            
-            try {
-                const response = await fetch('/api/config', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify(updates)
-                });
-                
-                const result = await response.json();
-                
-                if (result.success) {
-                    showAlert(`${category.charAt(0).toUpperCase() + category.slice(1)} settings saved successfully!`, 'success');
-                    loadConfig();
-                } else {
-                    showAlert(result.message || 'Failed to save configuration', 'error');
-                }
-            } catch (error) {
-                showAlert('Failed to save configuration: ' + error.message, 'error');
-            }
-        }
-        
-        // Load configuration history
-        async function loadHistory() {
-            try {
-                const response = await fetch('/api/history');
-                const history = await response.json();
-                
-                const tbody = document.getElementById('history-body');
-                tbody.innerHTML = '';
-                
-                if (history.length === 0) {
-                    tbody.innerHTML = '<tr><td colspan="5" style="text-align:center;">No history yet</td></tr>';
-                    return;
-                }
-                
-                for (const entry of history) {
-                    const row = tbody.insertRow();
-                    row.innerHTML = `
-                        <td>${new Date(entry.changed_at).toLocaleString()}</td>
-                        <td><strong>${entry.key}</strong></td>
-                        <td>${JSON.stringify(entry.old_value)}</td>
-                        <td>${JSON.stringify(entry.new_value)}</td>
-                        <td>${entry.changed_by}</td>
-                    `;
-                }
-            } catch (error) {
-                showAlert('Failed to load history', 'error');
-            }
-        }
-        
-        // Show alert message
-        function showAlert(message, type) {
-            const container = document.getElementById('alert-container');
-            const alert = document.createElement('div');
-            alert.className = `alert ${type}`;
-            alert.textContent = message;
-            alert.style.display = 'block';
-            
-            container.innerHTML = '';
-            container.appendChild(alert);
-            
-            // Auto-hide after 5 seconds
-            setTimeout(() => {
-                alert.style.display = 'none';
-            }, 5000);
-        }
-        
-        // Load config on page load
-        window.addEventListener('DOMContentLoaded', loadConfig);
-    </script>
+    <script src="/static/config_ui.js?v=__JS_VERSION__" defer></script>
 </body>
 </html>
 """
 
 
+# The page script lives in static/config_ui.js so browsers cache (and keep
+# the compiled bytecode for) it across page loads; the version stamp in the
+# script URL busts that cache whenever the file changes
+_JS_PATH = Path(__file__).parent / "static" / "config_ui.js"
+_JS_VERSION = hashlib.md5(_JS_PATH.read_bytes()).hexdigest()[:12]
+
+# The page is fully static (all dynamic data arrives via /api/*), so encode
+# it once at import time and skip Jinja entirely. Pre-compress the blob and
+# pre-build the response headers as well — it's mostly CSS/markup and
+# shrinks ~5x under gzip.
+HTML_BYTES = HTML_TEMPLATE.replace("__JS_VERSION__", _JS_VERSION).encode("utf-8")
+HTML_GZIP = gzip.compress(HTML_BYTES, 9)
+HTML_BROTLI = brotli.compress(HTML_BYTES, quality=11) if BROTLI_AVAILABLE else None
+_HTML_ETAG = f'"{hashlib.md5(HTML_BYTES).hexdigest()}"'
+_HTML_HEADERS = {
+    "Content-Type": "text/html; charset=utf-8",
+    "Cache-Control": "public, max-age=3600",
+    # The body varies by Accept-Encoding, so shared caches must key on
+    # it — otherwise a cached brotli body could be replayed to a
+    # gzip-only client
+    "Vary": "Accept-Encoding",
+    "ETag": _HTML_ETAG,
+}
+_HTML_GZIP_HEADERS = {**_HTML_HEADERS, "Content-Encoding": "gzip"}
+_HTML_BROTLI_HEADERS = {**_HTML_HEADERS, "Content-Encoding": "br"}
+
+
+# Only compress payloads big enough for gzip to pay for itself
+_COMPRESS_MIN_BYTES = 500
+
+
+@app.after_request
+def cache_static(response):
+    """Mark versioned static assets as immutable for a day"""
+    if request.path.startswith('/static/'):
+        response.headers["Cache-Control"] = "public, max-age=86400, immutable"
+    return response
+
+
+@app.after_request
+def compress_json(response):
+    """Gzip JSON API responses for clients that accept it"""
+    if (response.mimetype == "application/json"
+            and response.status_code == 200
+            and not response.direct_passthrough
+            and len(response.get_data()) >= _COMPRESS_MIN_BYTES
+            and "gzip" in request.headers.get("Accept-Encoding", "")):
+        response.set_data(gzip.compress(response.get_data(), 6))
+        response.headers["Content-Encoding"] = "gzip"
+        response.headers["Vary"] = "Accept-Encoding"
+    return response
+
+
 @app.route('/')
 def index():
-    """Render main configuration page"""
-    return render_template_string(HTML_TEMPLATE)
+    """Serve the pre-encoded configuration page"""
+    # Revalidation: browsers holding the current page get a bodyless 304
+    if request.headers.get("If-None-Match") == _HTML_ETAG:
+        return Response(status=304, headers={"ETag": _HTML_ETAG})
+
+    # Every variant is compressed once at import: prefer br, then gzip
+    accept_encoding = request.headers.get("Accept-Encoding", "")
+    if HTML_BROTLI is not None and "br" in accept_encoding:
+        return Response(HTML_BROTLI, headers=_HTML_BROTLI_HEADERS)
+    if "gzip" in accept_encoding:
+        return Response(HTML_GZIP, headers=_HTML_GZIP_HEADERS)
+    return Response(HTML_BYTES, headers=_HTML_HEADERS)
+
+
+@app.route('/api/schema', methods=['GET'])
+def get_schema():
+    """Get the static form schema (key/category/type per setting)"""
+    response = Response(_SCHEMA_JSON, mimetype="application/json")
+    response.headers["Cache-Control"] = "public, max-age=3600"
+    return response
 
 
 @app.route('/api/config', methods=['GET'])
 def get_config():
-    """Get current configuration"""
-    return jsonify(config_manager.get_config())
+    """Get current configuration (supports If-None-Match revalidation)"""
+    etag = config_manager.get_config_etag()
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status=304, headers={"ETag": etag})
+    return Response(config_manager.get_config_json(),
+                    mimetype="application/json", headers={"ETag": etag})
 
 
+# /api/config/batch is kept as an alias for callers that adopted it
+# before the main POST became atomic; both rules share one handler
 @app.route('/api/config', methods=['POST'])
+@app.route('/api/config/batch', methods=['POST'])
 def save_config():
-    """Save configuration updates"""
+    """Save configuration updates (one transaction per request)"""
     try:
-        updates = request.json
-        
-        for key, value in updates.items():
-            # Validate
-            is_valid, error = config_manager.validate_config(key, value)
-            if not is_valid:
-                return jsonify({'success': False, 'message': error}), 400
-            
-            # Save
-            success = config_manager.save_config(key, value, changed_by='ui')
-            if not success:
-                return jsonify({'success': False, 'message': f'Failed to save {key}'}), 500
-        
+        updates = _parse_request_json()
+
+        # Validate everything up front, then commit the batch atomically —
+        # one transaction (one fsync) instead of one per key
+        error = config_manager.validate_many(updates)
+        if error is not None:
+            return jsonify({'success': False, 'message': error}), 400
+
+        success = config_manager.save_config_many(list(updates.items()), changed_by='ui')
+        if not success:
+            return jsonify({'success': False, 'message': 'Failed to save configuration'}), 500
+
         return jsonify({'success': True, 'message': 'Configuration saved successfully'})
-    
+
     except Exception as e:
         logger.error(f"Error saving configuration: {e}")
         return jsonify({'success': False, 'message': str(e)}), 500
@@ -1065,9 +1506,15 @@ def save_config():
 
 @app.route('/api/history', methods=['GET'])
 def get_history():
-    """Get configuration change history"""
-    history = config_manager.get_history()
-    return jsonify(history)
+    """Get configuration change history (paginated via ?limit= and ?offset=)"""
+    try:
+        limit = min(int(request.args.get('limit', 200)), 1000)
+        offset = max(int(request.args.get('offset', 0)), 0)
+    except ValueError:
+        return jsonify({'success': False, 'message': 'limit/offset must be integers'}), 400
+
+    history = config_manager.get_history(limit=limit, offset=offset)
+    return _json_response(history)
 
 
 def run_config_ui(host: str = '0.0.0.0', port: int = 5001, debug: bool = False):
@@ -1081,7 +1528,20 @@ def run_config_ui(host: str = '0.0.0.0', port: int = 5001, debug: bool = False):
     """
     logger.info(f"Starting configuration UI on http://{host}:{port}")
     logger.info("Access the UI in your browser to manage settings")
-    app.run(host=host, port=port, debug=debug)
+
+    if debug:
+        # Autoreloader only in debug — it doubles the process in prod
+        app.run(host=host, port=port, debug=True, use_reloader=True)
+        return
+
+    # Werkzeug's dev server serialises requests; prefer a threaded
+    # production WSGI server so API calls don't block each other
+    try:
+        from waitress import serve
+        serve(app, host=host, port=port, threads=8)
+    except ImportError:
+        logger.warning("waitress not installed, falling back to Flask dev server")
+        app.run(host=host, port=port, threaded=True)
 
 
 if __name__ == '__main__':
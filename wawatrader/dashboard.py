@@ -27,27 +27,29 @@ Usage:
     dash.app.run(port=8050)
 """
 
-import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional, Any
+import gzip
 import json
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from loguru import logger
-import asyncio
 
 try:
-    from dash import Dash, html, dcc, Input, Output, dash_table, callback, ctx, State, ALL
+    from dash import Dash, html, dcc, Input, Output, callback, ctx, State, ALL, no_update
     import dash_bootstrap_components as dbc
-    import plotly.express as px
     DASH_AVAILABLE = True
     MODAL_AVAILABLE = True
 except ImportError:
     try:
         # Try importing just the core components
-        from dash import Dash, html, dcc, Input, Output, callback, ctx, State, ALL
-        import plotly.express as px
+        from dash import Dash, html, dcc, Input, Output, callback, ctx, State, ALL, no_update
         DASH_AVAILABLE = True
         MODAL_AVAILABLE = False
     except ImportError:
@@ -58,8 +60,187 @@ except ImportError:
     logger.info("Install with: pip install dash dash-bootstrap-components plotly")
     DASH_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Hot-loop parser for conversation records: orjson consumes the raw
+# bytes directly (no separate UTF-8 decode) and is several times faster
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 from wawatrader.alpaca_client import get_client
-from wawatrader.indicators import analyze_dataframe, get_latest_signals
+
+# Beyond this many candles the extra bars are sub-pixel on a typical
+# chart width; downsample before serializing the figure to the browser
+_MAX_CHART_BARS = 500
+
+# Cap the conversation feed: an unbounded DOM makes every 2s refresh
+# reflow the whole history of a multi-hour session. The tail cache is
+# sized to this, so every view shares the same newest-N bound
+_MAX_RENDERED_CONVERSATIONS = 100
+
+# Prebound formatters for the per-tick money fields; the format spec is
+# parsed once here instead of on every card render
+_fmt_money = "${:,.0f}".format
+_fmt_signed_money = "${:+,.0f}".format
+
+# Indexed by (pnl >= 0): a tuple load instead of a conditional plus
+# f-string interpolation on every rendered money cell
+_PNL_CLASS = ('compact-value negative', 'compact-value positive')
+
+# Accent colors for the thought feed, keyed by sentiment/decision; a
+# dict .get replaces the chained ternaries in the per-conversation loop
+_SENTIMENT_COLOR = {'BULLISH': '#00ff88', 'BEARISH': '#ff4444'}
+_DECISION_COLOR = {'BUY': '#00ff88', 'SELL': '#ff4444'}
+_NEUTRAL_COLOR = '#00aaff'
+
+# Position-card styles, shared by every card on every refresh instead of
+# being rebuilt as dict literals inside the render loop
+_POS_SYMBOL_STYLE = {"fontWeight": "bold", "fontSize": "12px", "color": "var(--accent-blue)"}
+_POS_QTY_STYLE = {"fontSize": "10px", "color": "var(--text-muted)", "marginLeft": "6px"}
+_POS_HEADER_STYLE = {"display": "flex", "justifyContent": "space-between", "alignItems": "center"}
+_POS_PNL_STYLE = {"fontSize": "11px", "textAlign": "right"}
+_POS_CARD_STYLE = {"background": "var(--bg-secondary)", "border": "1px solid var(--border-color)",
+                   "borderRadius": "4px", "padding": "6px 8px", "margin": "3px 0"}
+
+# Placeholder market-intelligence payload served until a real source is
+# wired in; constant, so build it once instead of per call
+_MOCK_INTEL = {
+    "market_sentiment": "bullish",
+    "confidence": 75,
+    "opportunities": [
+        "AAPL showing strong momentum",
+        "Tech sector outperforming",
+        "Low volatility environment"
+    ],
+    "risks": [
+        "High market concentration",
+        "Earnings season approaching"
+    ]
+}
+
+
+@lru_cache(maxsize=256)
+def _compact_metric(label: str, value: str, value_class: str = "compact-value neutral"):
+    """
+    Label/value card for the performance grid.
+
+    Memoized on its rendered strings: between ticks most values repeat
+    (equity rarely moves every 5s), so the same component tree is reused
+    instead of reallocating two html.Divs per cell. Callers must treat
+    the result as immutable, which Dash already requires.
+    """
+    return html.Div([
+        html.Div(label, className="compact-label"),
+        html.Div(value, className=value_class)
+    ], className="compact-metric")
+
+# Static chart styling, built and schema-validated once at import; the
+# per-tick callbacks apply these by reference instead of re-allocating
+# (and re-validating) the same nested dicts every refresh
+_MAIN_CHART_LAYOUT = go.Layout(
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    font=dict(color='#ffffff', family='JetBrains Mono', size=11),
+    xaxis=dict(
+        gridcolor='rgba(255,255,255,0.08)',
+        showgrid=True,
+        zeroline=False,
+        color='#cccccc',
+        showticklabels=True,
+        tickfont=dict(size=10),
+        fixedrange=False  # Allow zooming
+    ),
+    yaxis=dict(
+        title=dict(text="Price ($)", font=dict(size=11)),
+        gridcolor='rgba(255,255,255,0.08)',
+        showgrid=True,
+        zeroline=False,
+        color='#cccccc',
+        side='right',
+        tickfont=dict(size=10),
+        tickformat=',.2f',
+        fixedrange=False  # Allow zooming
+    ),
+    yaxis2=dict(
+        title=dict(text="Volume", font=dict(size=10)),
+        overlaying='y',
+        side='left',
+        showgrid=False,
+        color='#888888',
+        tickfont=dict(size=9),
+        showticklabels=True,
+        fixedrange=False
+    ),
+    showlegend=False,
+    margin=dict(l=60, r=60, t=10, b=30),  # Reduced margins for better space usage
+    hovermode='x unified',
+    hoverlabel=dict(
+        bgcolor='rgba(42, 42, 42, 0.9)',
+        bordercolor='rgba(255, 255, 255, 0.2)',
+        font=dict(color='white', family='JetBrains Mono', size=10)
+    ),
+    autosize=True,  # Enable automatic sizing
+    dragmode='pan'  # Set default drag mode
+)
+
+_EMPTY_CHART_LAYOUT = go.Layout(
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    xaxis=dict(showgrid=False, showticklabels=False),
+    yaxis=dict(showgrid=False, showticklabels=False),
+    margin=dict(l=0, r=0, t=0, b=0)
+)
+
+
+def _downsample_ohlc(bars, max_bars: int = _MAX_CHART_BARS):
+    """
+    Aggregate a bar DataFrame down to at most `max_bars` OHLC buckets.
+
+    Each bucket keeps its first open, max high, min low and last close
+    (volume sums), so wicks and extremes survive — a plain stride sample
+    silently drops the highs and lows that fall between kept rows. One
+    vectorized reduceat pass per column, no Python-level loop.
+    """
+    if len(bars) <= max_bars:
+        return bars
+
+    edges = np.linspace(0, len(bars), max_bars + 1).astype(np.intp)[:-1]
+    last_idx = np.append(edges[1:], len(bars)) - 1
+
+    out = bars.iloc[edges].copy()  # carries index and first-open per bucket
+    out['high'] = np.maximum.reduceat(bars['high'].to_numpy(), edges)
+    out['low'] = np.minimum.reduceat(bars['low'].to_numpy(), edges)
+    out['close'] = bars['close'].to_numpy()[last_idx]
+    if 'volume' in bars.columns:
+        out['volume'] = np.add.reduceat(bars['volume'].to_numpy(), edges)
+    return out
+
+
+# Constant index page, materialized once at import. The theme CSS and
+# the modal/scroll helpers live in assets/ so Dash serves them as
+# cacheable files instead of re-sending them inline with every page load
+_INDEX_HTML = '''
+<!DOCTYPE html>
+<html>
+    <head>
+        {%metas%}
+        <title>{%title%}</title>
+        {%favicon%}
+        {%css%}
+    </head>
+    <body>
+        {%app_entry%}
+        <footer>
+            {%config%}
+            {%scripts%}
+            {%renderer%}
+        </footer>
+    </body>
+</html>
+'''
 
 
 class Dashboard:
@@ -73,7 +254,19 @@ class Dashboard:
     - Responsive layout that fits any screen
     - Advanced analytics and monitoring
     """
-    
+
+    # Fixed attribute layout: callbacks touch self dozens of times per
+    # tick, and slotted access skips the per-instance __dict__ lookup
+    __slots__ = (
+        'data_dir', 'alpaca', 'app',
+        '_tick_lock', '_tick_cache', '_tick_cache_ttl', '_tick_executor',
+        '_bars_cache', '_bars_cache_ttl', '_bars_cache_max',
+        '_chart_cache', '_empty_chart_cache',
+        '_conv_cache', '_conv_offset', '_conv_partial', '_conv_lock',
+        '_last_hashes',
+        '_no_positions_cards', '_positions_unavailable_cards',
+    )
+
     def __init__(self, data_dir: str = "trading_data"):
         """Initialize professional dashboard"""
         if not DASH_AVAILABLE:
@@ -84,7 +277,63 @@ class Dashboard:
         
         # Initialize components
         self.alpaca = get_client()
-        
+
+        # One shared Alpaca snapshot per interval tick: several callbacks
+        # fire on the same n_intervals, so fetch account/positions/market
+        # status once per tick and fan the data out instead of letting
+        # each callback repeat the same HTTP round-trips
+        self._tick_lock = threading.Lock()
+        self._tick_cache = (0.0, None)  # (monotonic fetch time, data)
+        # The background refresher rewarms the snapshot every 2s, so a
+        # 3s TTL means request threads essentially always read memory
+        # and only fall back to a synchronous fetch on a cold start
+        self._tick_cache_ttl = 3.0
+        self._tick_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="tick-fetch")
+
+        # Daily bars change at most once per trading day, so cache them
+        # with a short TTL instead of re-downloading history on every
+        # 5-second chart tick. LRU-capped so flipping through many
+        # symbols can't grow the cache without bound.
+        self._bars_cache = OrderedDict()  # (symbol, timeframe, limit) -> (fetched_at, df)
+        self._bars_cache_ttl = 60.0
+        self._bars_cache_max = 32
+
+        # Fingerprints of the last payload emitted per panel group, so
+        # unchanged snapshots skip component construction entirely
+        self._last_hashes = {}
+
+        # Incremental tail state for the conversation log: the newest
+        # parsed records (render-cap bounded) plus the byte offset
+        # already consumed. The lock keeps concurrent request threads
+        # (waitress) from tailing the same byte range twice and
+        # duplicating records
+        self._conv_cache = deque(maxlen=_MAX_RENDERED_CONVERSATIONS)
+        self._conv_offset = 0
+        self._conv_partial = b''
+        self._conv_lock = threading.Lock()
+
+        # Last figure per symbol with its (symbol, last_ts, len) key:
+        # unchanged ticks skip the rebuild and payload entirely, while a
+        # fresh page load gets the cached figure without a rebuild
+        self._chart_cache = {}
+
+        # Error/empty figures keyed by message — identical every time,
+        # so build each once and reuse across ticks
+        self._empty_chart_cache = {}
+
+        # Static placeholder cards, built once instead of per tick
+        _placeholder_card_style = {"background": "var(--bg-secondary)", "border": "1px solid var(--border-color)", "borderRadius": "4px"}
+        self._no_positions_cards = [
+            html.Div([
+                html.Div("No active positions", style={"fontSize": "11px", "color": "var(--text-muted)", "textAlign": "center", "padding": "12px"})
+            ], style=_placeholder_card_style)
+        ]
+        self._positions_unavailable_cards = [
+            html.Div([
+                html.Div("Positions unavailable", style={"fontSize": "11px", "color": "var(--accent-red)", "textAlign": "center", "padding": "12px"})
+            ], style=_placeholder_card_style)
+        ]
+
         # Create Dash app with custom styling
         self.app = Dash(
             __name__,
@@ -107,958 +356,77 @@ class Dashboard:
         
         # Register advanced callbacks
         self._register_professional_callbacks()
-        
+
+        # Faster JSON in, smaller JSON out on the underlying Flask server
+        self._install_json_provider()
+        self._enable_compression()
+
         logger.info("🚀 Professional Dashboard initialized")
+
+    def _install_json_provider(self):
+        """Swap Flask's JSON provider for orjson when available (2-5x faster)"""
+        if not ORJSON_AVAILABLE:
+            return
+        try:
+            from flask.json.provider import DefaultJSONProvider
+        except ImportError:
+            # Flask < 2.2 predates the provider API
+            return
+
+        class OrjsonProvider(DefaultJSONProvider):
+            def dumps(self, obj, **kwargs):
+                return orjson.dumps(obj, default=self.default).decode("utf-8")
+
+            def loads(self, s, **kwargs):
+                return orjson.loads(s)
+
+        self.app.server.json = OrjsonProvider(self.app.server)
+
+    def _enable_compression(self):
+        """Gzip large JSON responses (figures, panels) for clients that accept it"""
+        from flask import request
+
+        # Dash fingerprints asset URLs, so the files can be cached hard
+        @self.app.server.after_request
+        def cache_assets(response):
+            if request.path.startswith('/assets/'):
+                response.headers['Cache-Control'] = 'public, max-age=86400, immutable'
+            return response
+
+        # Only compress payloads big enough for gzip to pay for itself
+        min_bytes = 500
+
+        @self.app.server.after_request
+        def compress_json(response):
+            if (response.mimetype == "application/json"
+                    and response.status_code == 200
+                    and not response.direct_passthrough
+                    and len(response.get_data()) >= min_bytes
+                    and "gzip" in request.headers.get("Accept-Encoding", "")):
+                response.set_data(gzip.compress(response.get_data(), 6))
+                response.headers["Content-Encoding"] = "gzip"
+                response.headers["Vary"] = "Accept-Encoding"
+            return response
     
     def _add_custom_styles(self):
-        """Add custom CSS for professional trading interface"""
-        self.app.index_string = '''
-        <!DOCTYPE html>
-        <html>
-            <head>
-                {%metas%}
-                <title>{%title%}</title>
-                {%favicon%}
-                {%css%}
-                <style>
-                    /* Professional Dark Trading Theme */
-                    :root {
-                        --bg-primary: #0a0a0a;
-                        --bg-secondary: #1a1a1a;
-                        --bg-tertiary: #2a2a2a;
-                        --border-color: #333333;
-                        --text-primary: #ffffff;
-                        --text-secondary: #cccccc;
-                        --text-muted: #888888;
-                        --accent-green: #00ff88;
-                        --accent-red: #ff4444;
-                        --accent-blue: #00aaff;
-                        --accent-orange: #ffaa00;
-                        --accent-purple: #aa44ff;
-                        --glass-bg: rgba(42, 42, 42, 0.8);
-                        --glass-border: rgba(255, 255, 255, 0.1);
-                    }
-                    
-                    body {
-                        background: var(--bg-primary);
-                        color: var(--text-primary);
-                        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-                        margin: 0;
-                        padding: 0;
-                    }
-                    
-                    /* Animations */
-                    @keyframes pulse {
-                        0%, 100% {
-                            opacity: 1;
-                        }
-                        50% {
-                            opacity: 0.7;
-                        }
-                    }
-                    
-                    /* Professional Container */
-                    .professional-container {
-                        background: var(--bg-primary);
-                        min-height: 100vh;
-                        padding: 0;
-                        max-width: 100% !important;
-                        margin: 0;
-                    }
-                    
-                    /* Glass Cards */
-                    .glass-card {
-                        background: var(--glass-bg);
-                        border: 1px solid var(--glass-border);
-                        border-radius: 8px;
-                        backdrop-filter: blur(10px);
-                        box-shadow: 0 4px 16px rgba(0, 0, 0, 0.3);
-                    }
-                    
-                    /* Header Bar */
-                    .header-bar {
-                        background: linear-gradient(135deg, var(--bg-secondary), var(--bg-tertiary));
-                        border-bottom: 2px solid var(--accent-blue);
-                        padding: 14px 24px;
-                        display: flex;
-                        align-items: center;
-                        justify-content: space-between;
-                        position: sticky;
-                        top: 0;
-                        z-index: 1000;
-                        box-shadow: 0 2px 10px rgba(0, 0, 0, 0.5);
-                        min-height: 60px;
-                    }
-                    
-                    .header-title {
-                        font-size: 24px;
-                        font-weight: bold;
-                        color: var(--accent-blue);
-                        text-shadow: 0 0 10px rgba(0, 170, 255, 0.3);
-                    }
-                    
-                    .header-status {
-                        display: flex;
-                        gap: 20px;
-                        align-items: center;
-                    }
-                    
-                    .status-badge {
-                        padding: 4px 12px;
-                        border-radius: 20px;
-                        font-size: 12px;
-                        font-weight: 500;
-                        text-transform: uppercase;
-                        letter-spacing: 0.5px;
-                    }
-                    
-                    .status-live {
-                        background: linear-gradient(45deg, var(--accent-green), #00cc66);
-                        color: var(--bg-primary);
-                        animation: pulse 2s infinite;
-                    }
-                    
-                    @keyframes pulse {
-                        0%, 100% { opacity: 1; }
-                        50% { opacity: 0.7; }
-                    }
-                    
-                    /* Main Grid Layout - 2 Column: LLM Left, Chart/Performance/Positions Right */
-                    .main-grid {
-                        display: grid;
-                        grid-template-columns: minmax(320px, 30%) 1fr;
-                        grid-template-rows: minmax(400px, 55%) minmax(200px, 45%);
-                        gap: 12px;
-                        padding: 12px;
-                        height: calc(100vh - 90px);
-                        max-width: 100vw;
-                        overflow: hidden;
-                    }
-                    
-                    @media (max-width: 1400px) {
-                        .main-grid {
-                            grid-template-columns: minmax(300px, 32%) 1fr;
-                            grid-template-rows: minmax(360px, 56%) minmax(180px, 44%);
-                            gap: 10px;
-                            padding: 10px;
-                        }
-                    }
-                    
-                    @media (max-width: 1200px) {
-                        .main-grid {
-                            grid-template-columns: 1fr;
-                            grid-template-rows: minmax(300px, 40%) minmax(200px, 30%) minmax(200px, 30%);
-                            height: auto;
-                        }
-                    }
-                    
-                    @media (max-width: 768px) {
-                        .main-grid {
-                            grid-template-columns: 1fr;
-                            grid-template-rows: auto;
-                            padding: 8px;
-                            gap: 8px;
-                            height: auto;
-                        }
-                    }
-                    
-                    /* LLM Mind Panel - Full left side */
-                    .llm-mind {
-                        grid-column: 1;
-                        grid-row: 1 / -1;
-                        background: var(--glass-bg);
-                        border: 1px solid var(--glass-border);
-                        border-radius: 8px;
-                        padding: 12px;
-                        overflow: hidden;
-                        min-height: 0;
-                        max-height: calc(100vh - 100px);
-                        height: calc(100vh - 100px);
-                        position: relative;
-                        display: flex;
-                        flex-direction: column;
-                    }
-                    
-                    .llm-thought {
-                        background: rgba(0, 170, 255, 0.1);
-                        border-left: 3px solid var(--accent-blue);
-                        padding: 8px 10px;
-                        margin: 6px 0;
-                        border-radius: 0 6px 6px 0;
-                        font-family: 'JetBrains Mono', monospace;
-                        font-size: 11px;
-                        line-height: 1.4;
-                        word-wrap: break-word;
-                        overflow-wrap: break-word;
-                        white-space: pre-wrap;
-                        /* Removed max-height to show full text */
-                    }
-                    
-                    .confidence-bar {
-                        background: var(--bg-tertiary);
-                        height: 5px;
-                        border-radius: 3px;
-                        margin: 6px 0;
-                        overflow: hidden;
-                    }
-                    
-                    .confidence-fill {
-                        height: 100%;
-                        border-radius: 3px;
-                        transition: width 0.3s ease;
-                    }
-                    
-                    /* LLM Mind Panel specific styling */
-                    .llm-mind-header {
-                        position: sticky;
-                        top: 0;
-                        background: var(--glass-bg);
-                        padding-bottom: 8px;
-                        margin-bottom: 6px;
-                        border-bottom: 1px solid var(--glass-border);
-                        z-index: 10;
-                        flex-shrink: 0;
-                    }
-                    
-                    /* Custom Dash Tabs Styling */
-                    .custom-tabs-container {
-                        margin-bottom: 0;
-                        flex-shrink: 0;
-                    }
-                    
-                    .custom-tabs {
-                        height: auto !important;
-                        border-bottom: 2px solid var(--border-color) !important;
-                    }
-                    
-                    .custom-tab {
-                        background: var(--bg-secondary) !important;
-                        border: 1px solid var(--border-color) !important;
-                        border-bottom: 2px solid var(--border-color) !important;
-                        color: var(--text-muted) !important;
-                        padding: 6px 14px !important;
-                        font-size: 11px !important;
-                        font-weight: 500 !important;
-                        transition: all 0.2s ease !important;
-                        border-radius: 6px 6px 0 0 !important;
-                        margin-right: 2px !important;
-                        min-height: auto !important;
-                    }
-                    
-                    .custom-tab:hover {
-                        background: var(--bg-tertiary) !important;
-                        color: var(--text-primary) !important;
-                        border-bottom-color: var(--accent-blue) !important;
-                    }
-                    
-                    .custom-tab--selected {
-                        background: var(--bg-primary) !important;
-                        color: var(--accent-blue) !important;
-                        border-color: var(--accent-blue) !important;
-                        border-bottom: 2px solid var(--accent-blue) !important;
-                        font-weight: 600 !important;
-                        position: relative;
-                        bottom: -2px;
-                    }
-                    
-                    .llm-thoughts-container {
-                        height: calc(100% - 110px);
-                        overflow-y: auto;
-                        overflow-x: hidden;
-                        padding-right: 8px;
-                        padding-top: 4px;
-                        padding-left: 4px;
-                        padding-bottom: 4px;
-                        flex: 1;
-                        min-height: 0;
-                        scrollbar-width: thin;
-                        scrollbar-color: var(--accent-blue) var(--bg-secondary);
-                    }
-                    
-                    .llm-thoughts-container::-webkit-scrollbar {
-                        width: 8px;
-                    }
-                    
-                    .llm-thoughts-container::-webkit-scrollbar-track {
-                        background: var(--bg-secondary);
-                        border-radius: 4px;
-                    }
-                    
-                    .llm-thoughts-container::-webkit-scrollbar-thumb {
-                        background: var(--accent-blue);
-                        border-radius: 4px;
-                        border: 1px solid var(--bg-secondary);
-                    }
-                    
-                    .llm-thoughts-container::-webkit-scrollbar-thumb:hover {
-                        background: var(--accent-green);
-                    }
-                    
-                    /* Chart Panel - Top right */
-                    .chart-panel {
-                        background: var(--glass-bg);
-                        border: 1px solid var(--glass-border);
-                        border-radius: 8px;
-                        overflow: hidden;
-                        min-width: 0;
-                        min-height: 400px;  /* Minimum height for chart visibility */
-                        grid-column: 2;
-                        grid-row: 1;
-                        display: flex;
-                        flex-direction: column;
-                    }
-                    
-                    /* Market Intel - No longer used in new layout */
-                    .market-intel {
-                        background: var(--glass-bg);
-                        border: 1px solid var(--glass-border);
-                        border-radius: 8px;
-                        padding: 20px;
-                        overflow-y: auto;
-                        min-height: 0;
-                        display: none; /* Hidden in new layout */
-                    }
-                    
-                    /* Metric Cards - Optimized for laptop screens */
-                    .metric-card {
-                        background: var(--bg-secondary);
-                        border: 1px solid var(--border-color);
-                        border-radius: 6px;
-                        padding: 8px 12px;
-                        margin: 4px 0;
-                        transition: all 0.2s ease;
-                        min-height: 50px;
-                        display: flex;
-                        flex-direction: column;
-                        justify-content: center;
-                    }
-                    
-                    .metric-card:hover {
-                        border-color: var(--accent-blue);
-                        box-shadow: 0 2px 8px rgba(0, 170, 255, 0.2);
-                    }
-                    
-                    .metric-value {
-                        font-family: 'JetBrains Mono', monospace;
-                        font-size: 16px;
-                        font-weight: bold;
-                        margin: 2px 0;
-                        line-height: 1.2;
-                    }
-                    
-                    .metric-label {
-                        font-size: 10px;
-                        color: var(--text-muted);
-                        text-transform: uppercase;
-                        letter-spacing: 0.3px;
-                        margin-bottom: 2px;
-                    }
-                    
-                    /* Compact layout for bottom panels */
-                    .compact-grid {
-                        display: grid;
-                        grid-template-columns: 1fr 1fr;
-                        gap: 8px;
-                        margin-bottom: 12px;
-                    }
-                    
-                    .compact-metric {
-                        background: var(--bg-secondary);
-                        border: 1px solid var(--border-color);
-                        border-radius: 4px;
-                        padding: 6px 8px;
-                        text-align: center;
-                    }
-                    
-                    .compact-value {
-                        font-family: 'JetBrains Mono', monospace;
-                        font-size: 14px;
-                        font-weight: bold;
-                        margin: 1px 0;
-                    }
-                    
-                    .compact-label {
-                        font-size: 9px;
-                        color: var(--text-muted);
-                        text-transform: uppercase;
-                        letter-spacing: 0.2px;
-                    }
-                    
-                    .positive { color: var(--accent-green); }
-                    .negative { color: var(--accent-red); }
-                    .neutral { color: var(--text-secondary); }
-                    
-                    /* LLM Refresh Button */
-                    .llm-refresh-btn:hover {
-                        background: rgba(0, 170, 255, 0.2) !important;
-                        border-color: #00aaff !important;
-                        transform: scale(1.05);
-                    }
-                    
-                    .llm-refresh-btn:active {
-                        transform: scale(0.95);
-                    }
-                    
-                    /* LLM Tab improvements */
-                    .llm-thoughts-container {
-                        flex: 1;
-                        min-height: 0;
-                        overflow-y: auto;
-                        overflow-x: hidden;
-                        padding: 8px 12px;
-                    }
-                    
-                    .llm-thoughts-container::-webkit-scrollbar {
-                        width: 8px;
-                    }
-                    
-                    .llm-thoughts-container::-webkit-scrollbar-track {
-                        background: rgba(0, 0, 0, 0.2);
-                        border-radius: 4px;
-                    }
-                    
-                    .llm-thoughts-container::-webkit-scrollbar-thumb {
-                        background: rgba(0, 170, 255, 0.4);
-                        border-radius: 4px;
-                    }
-                    
-                    .llm-thoughts-container::-webkit-scrollbar-thumb:hover {
-                        background: rgba(0, 170, 255, 0.6);
-                    }
-                    
-                    /* Configuration Modal */
-                    .config-button {
-                        background: var(--bg-tertiary);
-                        border: 1px solid var(--border-color);
-                        border-radius: 6px;
-                        padding: 8px 12px;
-                        cursor: pointer;
-                        transition: all 0.2s ease;
-                        color: var(--text-primary);
-                        font-size: 14px;
-                        margin-left: 12px;
-                    }
-                    
-                    .config-button:hover {
-                        background: var(--accent-blue);
-                        border-color: var(--accent-blue);
-                        color: var(--bg-primary);
-                        transform: translateY(-1px);
-                    }
-                    
-                    .config-button:focus {
-                        outline: 2px solid var(--accent-blue);
-                    }
-                    
-                    .config-modal {
-                        position: fixed;
-                        top: 0;
-                        left: 0;
-                        width: 100%;
-                        height: 100%;
-                        background: rgba(0, 0, 0, 0.8);
-                        backdrop-filter: blur(4px);
-                        z-index: 10000;
-                        display: flex;
-                        align-items: center;
-                        justify-content: center;
-                    }
-                    
-                    .config-content {
-                        background: var(--bg-secondary);
-                        border: 2px solid var(--accent-blue);
-                        border-radius: 12px;
-                        width: 90%;
-                        max-width: 1000px;
-                        height: 80vh;
-                        max-height: 800px;
-                        overflow: hidden;
-                        display: flex;
-                        flex-direction: column;
-                        box-shadow: 0 10px 40px rgba(0, 0, 0, 0.7);
-                    }
-                    
-                    .config-header {
-                        background: linear-gradient(135deg, var(--bg-tertiary), var(--accent-blue));
-                        padding: 16px 24px;
-                        display: flex;
-                        justify-content: space-between;
-                        align-items: center;
-                        border-bottom: 1px solid var(--glass-border);
-                    }
-                    
-                    .config-title {
-                        color: var(--text-primary);
-                        font-size: 20px;
-                        font-weight: bold;
-                        margin: 0;
-                    }
-                    
-                    .config-close {
-                        background: none;
-                        border: none;
-                        color: var(--text-primary);
-                        font-size: 24px;
-                        cursor: pointer;
-                        padding: 4px 8px;
-                        border-radius: 4px;
-                        transition: background 0.2s;
-                    }
-                    
-                    .config-close:hover {
-                        background: rgba(255, 255, 255, 0.1);
-                    }
-                    
-                    .config-tabs {
-                        background: var(--bg-tertiary);
-                        display: flex;
-                        border-bottom: 1px solid var(--glass-border);
-                    }
-                    
-                    .config-tab {
-                        padding: 12px 24px;
-                        cursor: pointer;
-                        border-bottom: 3px solid transparent;
-                        color: var(--text-muted);
-                        font-weight: 500;
-                        transition: all 0.2s;
-                        flex: 1;
-                        text-align: center;
-                    }
-                    
-                    .config-tab:hover {
-                        color: var(--text-primary);
-                        background: var(--bg-secondary);
-                    }
-                    
-                    .config-tab.active {
-                        color: var(--accent-blue);
-                        border-bottom-color: var(--accent-blue);
-                        background: var(--bg-secondary);
-                    }
-                    
-                    .config-body {
-                        flex: 1;
-                        overflow-y: auto;
-                        padding: 24px;
-                    }
-                    
-                    .config-section {
-                        margin-bottom: 32px;
-                    }
-                    
-                    .config-section-title {
-                        color: var(--accent-blue);
-                        font-size: 16px;
-                        font-weight: bold;
-                        margin-bottom: 16px;
-                        border-bottom: 1px solid var(--glass-border);
-                        padding-bottom: 8px;
-                    }
-                    
-                    .config-field {
-                        margin-bottom: 20px;
-                    }
-                    
-                    .config-label {
-                        display: block;
-                        color: var(--text-primary);
-                        font-size: 13px;
-                        font-weight: 500;
-                        margin-bottom: 6px;
-                    }
-                    
-                    .config-input, .config-textarea {
-                        width: 100%;
-                        background: var(--bg-primary);
-                        border: 1px solid var(--border-color);
-                        border-radius: 6px;
-                        padding: 10px 12px;
-                        color: var(--text-primary);
-                        font-family: 'JetBrains Mono', monospace;
-                        font-size: 12px;
-                        line-height: 1.4;
-                        transition: border-color 0.2s;
-                        box-sizing: border-box;
-                    }
-                    
-                    .config-textarea {
-                        resize: vertical;
-                        min-height: 120px;
-                        max-height: 300px;
-                    }
-                    
-                    .config-input:focus, .config-textarea:focus {
-                        outline: none;
-                        border-color: var(--accent-blue);
-                        box-shadow: 0 0 0 2px rgba(0, 170, 255, 0.2);
-                    }
-                    
-                    .config-help {
-                        font-size: 11px;
-                        color: var(--text-muted);
-                        margin-top: 4px;
-                        line-height: 1.3;
-                    }
-                    
-                    .config-save-btn {
-                        background: var(--accent-green);
-                        color: var(--bg-primary);
-                        border: none;
-                        border-radius: 6px;
-                        padding: 10px 20px;
-                        font-weight: bold;
-                        cursor: pointer;
-                        transition: all 0.2s;
-                        margin-right: 12px;
-                    }
-                    
-                    .config-save-btn:hover {
-                        background: var(--accent-blue);
-                        transform: translateY(-1px);
-                    }
-                    
-                    .config-reset-btn {
-                        background: var(--accent-red);
-                        color: var(--text-primary);
-                        border: none;
-                        border-radius: 6px;
-                        padding: 10px 20px;
-                        font-weight: bold;
-                        cursor: pointer;
-                        transition: all 0.2s;
-                    }
-                    
-                    .config-reset-btn:hover {
-                        background: #cc3333;
-                        transform: translateY(-1px);
-                    }
-                    
-                    .config-grid {
-                        display: grid;
-                        grid-template-columns: 1fr 1fr;
-                        gap: 20px;
-                    }
-                    
-                    @media (max-width: 768px) {
-                        .config-content {
-                            width: 95%;
-                            height: 90vh;
-                        }
-                        
-                        .config-grid {
-                            grid-template-columns: 1fr;
-                        }
-                        
-                        .config-tabs {
-                            flex-direction: column;
-                        }
-                        
-                        .config-tab {
-                            text-align: left;
-                        }
-                    }
-                    
-                    /* Scrollbars */
-                    ::-webkit-scrollbar {
-                        width: 8px;
-                    }
-                    
-                    ::-webkit-scrollbar-track {
-                        background: var(--bg-secondary);
-                    }
-                    
-                    ::-webkit-scrollbar-thumb {
-                        background: var(--border-color);
-                        border-radius: 4px;
-                    }
-                    
-                    ::-webkit-scrollbar-thumb:hover {
-                        background: var(--accent-blue);
-                    }
-                    
-                    /* Tables */
-                    .professional-table {
-                        background: var(--bg-secondary);
-                        color: var(--text-primary);
-                        border: none;
-                    }
-                    
-                    .professional-table th {
-                        background: var(--bg-tertiary);
-                        color: var(--text-primary);
-                        border: none;
-                        font-weight: 600;
-                        font-size: 11px;
-                        text-transform: uppercase;
-                        letter-spacing: 0.5px;
-                    }
-                    
-                    .professional-table td {
-                        background: var(--bg-secondary);
-                        color: var(--text-primary);
-                        border: none;
-                        font-family: 'JetBrains Mono', monospace;
-                        font-size: 12px;
-                    }
-                    
-                    /* Alerts */
-                    .alert-panel {
-                        position: fixed;
-                        top: 80px;
-                        right: 20px;
-                        width: 300px;
-                        z-index: 2000;
-                    }
-                    
-                    .alert-item {
-                        background: var(--glass-bg);
-                        border: 1px solid var(--accent-orange);
-                        border-radius: 6px;
-                        padding: 12px;
-                        margin: 8px 0;
-                        animation: slideIn 0.3s ease;
-                    }
-                    
-                    @keyframes slideIn {
-                        from { transform: translateX(100%); }
-                        to { transform: translateX(0); }
-                    }
-                    
-                    /* Responsive Design */
-                    /* Improved responsive layout for LLM positioning */
-                    @media (max-width: 1200px) {
-                        .llm-mind {
-                            grid-column: 1;
-                            grid-row: 1;
-                            max-height: 350px;
-                        }
-                        
-                        .chart-panel {
-                            grid-column: 2;
-                            grid-row: 1;
-                        }
-                        
-                        .market-intel {
-                            grid-column: 1 / -1;
-                            grid-row: 2;
-                            max-height: 300px;
-                        }
-                    }
-                    
-                    @media (max-width: 768px) {
-                        .main-grid {
-                            grid-template-columns: 1fr;
-                            grid-template-rows: auto auto auto auto auto;
-                            padding: 8px;
-                            gap: 8px;
-                        }
-                        
-                        .header-bar {
-                            padding: 8px 12px;
-                        }
-                        
-                        .header-title {
-                            font-size: 18px;
-                        }
-                        
-                        .llm-mind, .market-intel {
-                            padding: 12px;
-                            grid-column: 1;
-                            grid-row: auto;
-                            max-height: 250px;
-                        }
-                        
-                        .chart-panel {
-                            grid-column: 1;
-                            grid-row: auto;
-                            min-height: 300px;
-                        }
-                    }
-                </style>
-                <script>
-                    // Modal and tab management
-                    function openConfigModal() {
-                        document.getElementById('config-modal').style.display = 'flex';
-                        console.log('Config modal opened');
-                    }
-                    
-                    function closeConfigModal() {
-                        document.getElementById('config-modal').style.display = 'none';
-                        console.log('Config modal closed');
-                    }
-                    
-                    function switchTab(activeTab, inactiveTab) {
-                        // Update tab classes
-                        document.getElementById(activeTab).className = 'config-tab active';
-                        document.getElementById(inactiveTab).className = 'config-tab';
-                    }
-                    
-                    // LLM Tab auto-scroll management
-                    let llmAutoScroll = true;
-                    let lastConversationCount = 0;
-                    let lastScrollHeight = 0;
-                    let userIsScrolling = false;
-                    let scrollTimeout = null;
-                    
-                    function checkLLMScroll() {
-                        const container = document.querySelector('.llm-thoughts-container');
-                        if (!container) return;
-                        
-                        const isAtBottom = container.scrollHeight - container.scrollTop - container.clientHeight < 50;
-                        
-                        if (!isAtBottom && userIsScrolling) {
-                            // User has scrolled away from bottom
-                            llmAutoScroll = false;
-                            const indicator = document.getElementById('llm-scroll-indicator');
-                            if (indicator) indicator.style.display = 'block';
-                        } else if (isAtBottom) {
-                            // User is at bottom, enable auto-scroll
-                            llmAutoScroll = true;
-                            const indicator = document.getElementById('llm-scroll-indicator');
-                            if (indicator) indicator.style.display = 'none';
-                        }
-                    }
-                    
-                    function scrollToLatest(force = false) {
-                        const container = document.querySelector('.llm-thoughts-container');
-                        if (!container) return;
-                        
-                        const currentScrollHeight = container.scrollHeight;
-                        
-                        // Only auto-scroll if:
-                        // 1. Auto-scroll is enabled (user at bottom or forced)
-                        // 2. Content has actually changed (new conversations added)
-                        if ((llmAutoScroll || force) && currentScrollHeight !== lastScrollHeight) {
-                            container.scrollTop = container.scrollHeight;
-                            lastScrollHeight = currentScrollHeight;
-                        }
-                    }
-                    
-                    function onUserScroll() {
-                        userIsScrolling = true;
-                        
-                        // Clear existing timeout
-                        if (scrollTimeout) {
-                            clearTimeout(scrollTimeout);
-                        }
-                        
-                        // Set flag that user is done scrolling after 500ms of no scroll events
-                        scrollTimeout = setTimeout(() => {
-                            userIsScrolling = false;
-                            checkLLMScroll();
-                        }, 500);
-                        
-                        // Immediately check scroll position
-                        checkLLMScroll();
-                    }
-                    
-                    // Click handler for scroll indicator
-                    function scrollLLMToBottom() {
-                        const container = document.querySelector('.llm-thoughts-container');
-                        if (container) {
-                            llmAutoScroll = true;
-                            userIsScrolling = false;
-                            container.scrollTo({
-                                top: container.scrollHeight,
-                                behavior: 'smooth'
-                            });
-                            const indicator = document.getElementById('llm-scroll-indicator');
-                            if (indicator) indicator.style.display = 'none';
-                        }
-                    }
-                    
-                    // Mutation observer to detect content changes
-                    function setupContentObserver() {
-                        const container = document.querySelector('.llm-thoughts-container');
-                        if (!container) {
-                            // Retry after a short delay if container not found
-                            setTimeout(setupContentObserver, 500);
-                            return;
-                        }
-                        
-                        const observer = new MutationObserver((mutations) => {
-                            // Content has changed, scroll if auto-scroll enabled
-                            scrollToLatest();
-                        });
-                        
-                        observer.observe(container, {
-                            childList: true,
-                            subtree: true
-                        });
-                    }
-                    
-                    // Initialize when DOM is ready
-                    document.addEventListener('DOMContentLoaded', function() {
-                        // Add click handlers
-                        const configBtn = document.getElementById('config-button');
-                        const closeBtn = document.getElementById('config-close');
-                        const llmTab = document.getElementById('llm-tab');
-                        const traderTab = document.getElementById('trader-tab');
-                        
-                        if (configBtn) {
-                            configBtn.addEventListener('click', openConfigModal);
-                        }
-                        
-                        if (closeBtn) {
-                            closeBtn.addEventListener('click', closeConfigModal);
-                        }
-                        
-                        // Close modal when clicking backdrop
-                        const modal = document.getElementById('config-modal');
-                        if (modal) {
-                            modal.addEventListener('click', function(e) {
-                                if (e.target === modal) {
-                                    closeConfigModal();
-                                }
-                            });
-                        }
-                        
-                        // LLM scroll management
-                        const llmContainer = document.querySelector('.llm-thoughts-container');
-                        if (llmContainer) {
-                            llmContainer.addEventListener('scroll', onUserScroll);
-                        }
-                        
-                        const scrollIndicator = document.getElementById('llm-scroll-indicator');
-                        if (scrollIndicator) {
-                            scrollIndicator.addEventListener('click', scrollLLMToBottom);
-                        }
-                        
-                        // Setup mutation observer to detect content changes
-                        setupContentObserver();
-                        
-                        console.log('Config modal and smart LLM scroll handlers initialized');
-                    });
-                </script>
-            </head>
-            <body>
-                {%app_entry%}
-                <footer>
-                    {%config%}
-                    {%scripts%}
-                    {%renderer%}
-                </footer>
-            </body>
-        </html>
-        '''
+        """Point the app at the prebuilt index page"""
+        self.app.index_string = _INDEX_HTML
     
     def _build_professional_layout(self):
         """Build the professional trading interface layout"""
         
         self.app.layout = html.Div([
-            # Auto-refresh components
-            dcc.Interval(
-                id='main-interval',
-                interval=5000,  # 5 seconds for professional real-time updates
-                n_intervals=0
-            ),
-            
+            # One shared clock; a clientside router fans it out to the
+            # 5s (main) and 2s (LLM) trigger stores, so off-beat ticks
+            # never leave the browser
             dcc.Interval(
-                id='llm-interval', 
-                interval=2000,  # 2 seconds for LLM thoughts
+                id='tick',
+                interval=1000,
                 n_intervals=0
             ),
+            dcc.Store(id='main-trigger'),
+            dcc.Store(id='llm-trigger'),
+            dcc.Store(id='account-store'),
             
             # Header Bar
             html.Div([
@@ -1314,28 +682,48 @@ class Dashboard:
     
     def _register_professional_callbacks(self):
         """Register callbacks for professional dashboard"""
-        
-        # Split into separate callbacks to avoid Dash multi-output bug
-        @self.app.callback(
-            Output('system-time', 'children'),
-            [Input('main-interval', 'n_intervals')]
+
+        # Fan the shared 1s clock out to the two trigger stores in the
+        # browser. Off-beats return no_update, so they never generate a
+        # server round-trip, and the 5s/2s cadences can't pile up behind
+        # two independently scheduled intervals
+        self.app.clientside_callback(
+            """
+            function(n) {
+                const skip = window.dash_clientside.no_update;
+                return [n % 5 === 0 ? n : skip, n % 2 === 0 ? n : skip];
+            }
+            """,
+            [Output('main-trigger', 'data'),
+             Output('llm-trigger', 'data')],
+            [Input('tick', 'n_intervals')]
         )
-        def update_system_time(n):
-            """Update system time"""
-            return datetime.now().strftime("%H:%M:%S")
-        
-        @self.app.callback(
-            [Output('market-status', 'children'),
-             Output('market-status', 'style')],
-            [Input('main-interval', 'n_intervals')]
+
+        # The clock is purely a client concern — render it from the
+        # browser's own time on every beat, no server hop
+        self.app.clientside_callback(
+            """
+            function(n) {
+                return new Date().toLocaleTimeString('en-US', {hour12: false});
+            }
+            """,
+            Output('system-time', 'children'),
+            [Input('tick', 'n_intervals')]
         )
-        def update_market_status(n):
-            """Update market status"""
+
+
+        # The three main-tick bodies below feed one merged callback at
+        # the end of this block: a single request/response per tick
+        # carries the header badges, the chart and the bottom panels,
+        # with no_update filling whatever didn't change
+        def update_header_status(n):
+            """Update market status, market state and the account store"""
+            # Market status badge
             try:
-                market_status = self.alpaca.get_market_status()
+                market_status = self._get_tick_data(n)['market_status']
                 is_open = market_status.get('is_open', False)
                 status_text = market_status.get('status_text', '⚠️ UNKNOWN')
-                
+
                 if is_open:
                     market_status_style = {
                         "background": "var(--accent-green)",
@@ -1349,24 +737,17 @@ class Dashboard:
                         "color": "white",
                         "fontWeight": "600"
                     }
-                
-                return status_text, market_status_style
-                
+
             except Exception as e:
                 logger.error(f"Error getting market status: {e}")
-                return "⚠️ UNKNOWN", {
+                status_text = "⚠️ UNKNOWN"
+                market_status_style = {
                     "background": "var(--accent-red)",
                     "color": "white",
                     "fontWeight": "600"
                 }
-        
-        @self.app.callback(
-            [Output('market-state', 'children'),
-             Output('market-state', 'style')],
-            [Input('main-interval', 'n_intervals')]
-        )
-        def update_market_state(n):
-            """Update market state"""
+
+            # Market state badge
             try:
                 from wawatrader.market_state import get_market_state
                 market_state = get_market_state(self.alpaca)
@@ -1376,53 +757,58 @@ class Dashboard:
                     "color": "var(--text-secondary)",
                     "fontSize": "11px"
                 }
-                return state_display, state_style
             except Exception as e:
                 logger.debug(f"Market state not available: {e}")
-                return "", {"display": "none"}
-        
-        @self.app.callback(
-            [Output('pnl-header', 'children'),
-             Output('pnl-header', 'style')],
-            [Input('main-interval', 'n_intervals')]
-        )
-        def update_pnl_header(n):
-            """Update P&L header"""
+                state_display = ""
+                state_style = {"display": "none"}
+
+            # Account snapshot for the clientside P&L badge — just the
+            # two numbers the browser needs, not a rendered string
             try:
-                # Get account info
-                account = self.alpaca.get_account()
-                
-                # Handle both dict and object responses
-                if isinstance(account, dict):
-                    equity = float(account.get('equity', 0))
-                    last_equity = float(account.get('last_equity', equity))
-                else:
-                    equity = float(account.equity)
-                    last_equity = float(account.last_equity)
-                
-                pnl = equity - last_equity
-                pnl_pct = (pnl / last_equity) * 100 if last_equity > 0 else 0
-                
-                pnl_text = f"P&L: {'+' if pnl >= 0 else ''}{pnl:,.2f} ({pnl_pct:+.2f}%)"
-                pnl_color = "var(--accent-green)" if pnl >= 0 else "var(--accent-red)"
-                
-                pnl_style = {
-                    "background": "var(--bg-tertiary)", 
-                    "fontFamily": "JetBrains Mono",
-                    "color": pnl_color,
-                    "fontWeight": "bold"
+                account = self._get_tick_data(n)['account']
+
+                # The client always returns a dict with float-coerced
+                # numerics ({} on error), so no type dispatch is needed
+                equity = account.get('equity', 0.0)
+                account_data = {
+                    'equity': equity,
+                    'last_equity': account.get('last_equity', equity)
                 }
-                
-                return pnl_text, pnl_style
-                
             except Exception as e:
                 logger.error(f"Error updating P&L: {e}")
-                return "P&L: --", {"background": "var(--bg-tertiary)", "color": "var(--text-muted)"}
-        
-        @self.app.callback(
-            Output('main-chart', 'figure'),
-            [Input('main-interval', 'n_intervals')]
+                account_data = None
+
+            return (status_text, market_status_style,
+                    state_display, state_style,
+                    account_data)
+
+        # Format the P&L badge in the browser: the arithmetic and the
+        # color pick don't justify a server round-trip of their own
+        self.app.clientside_callback(
+            """
+            function(acct) {
+                if (!acct || !acct.last_equity) {
+                    return ['P&L: --',
+                            {background: 'var(--bg-tertiary)', color: 'var(--text-muted)'}];
+                }
+                const pnl = acct.equity - acct.last_equity;
+                const pct = (pnl / acct.last_equity) * 100;
+                const text = 'P&L: ' + (pnl >= 0 ? '+' : '')
+                    + pnl.toLocaleString('en-US', {minimumFractionDigits: 2, maximumFractionDigits: 2})
+                    + ' (' + (pct >= 0 ? '+' : '') + pct.toFixed(2) + '%)';
+                return [text, {
+                    background: 'var(--bg-tertiary)',
+                    fontFamily: 'JetBrains Mono',
+                    color: pnl >= 0 ? 'var(--accent-green)' : 'var(--accent-red)',
+                    fontWeight: 'bold'
+                }];
+            }
+            """,
+            [Output('pnl-header', 'children'),
+             Output('pnl-header', 'style')],
+            [Input('account-store', 'data')]
         )
+        
         def update_main_chart(n):
             """Update main candlestick chart with professional styling"""
             try:
@@ -1432,7 +818,7 @@ class Dashboard:
                 # Try to get recent data, fall back to daily data if subscription doesn't allow
                 bars = None
                 try:
-                    bars = self.alpaca.get_bars(symbol, limit=100, timeframe='1Day')  # Start with daily for reliability
+                    bars = self._get_bars_cached(symbol, limit=100, timeframe='1Day')  # Start with daily for reliability
                     logger.debug(f"Retrieved {len(bars) if not bars.empty else 0} daily bars for {symbol}")
                     if bars.empty:
                         raise ValueError("Empty daily data")
@@ -1440,7 +826,7 @@ class Dashboard:
                     logger.error(f"Daily data not available: {api_error}")
                     try:
                         # Fallback to a smaller dataset
-                        bars = self.alpaca.get_bars(symbol, limit=30, timeframe='1Day')
+                        bars = self._get_bars_cached(symbol, limit=30, timeframe='1Day')
                         logger.debug(f"Fallback: Retrieved {len(bars) if not bars.empty else 0} bars")
                         if bars.empty:
                             raise ValueError("Empty fallback data")
@@ -1450,17 +836,47 @@ class Dashboard:
                 
                 if bars is None or bars.empty:
                     return self._create_empty_chart("No data available")
-                
+
+                # Downsample long histories so the JSON payload and the
+                # browser draw loop stay bounded regardless of timeframe
+                bars = _downsample_ohlc(bars)
+
+                # Same bars as last time: reuse the built figure. The
+                # current session's bar mutates in place (same timestamp,
+                # same row count), so the fingerprint must include the
+                # last row's values or intraday updates would never render
+                chart_key = (symbol, bars.index[-1], len(bars),
+                             *bars.iloc[-1][['open', 'high', 'low',
+                                             'close', 'volume']])
+                # Always return the cached figure rather than no_update:
+                # with the tick routed through a clientside-written Store,
+                # ctx.triggered is non-empty even on a fresh page load, so
+                # a no_update here would leave new tabs blank
+                cached = self._chart_cache.get(symbol)
+                if cached is not None and cached[0] == chart_key:
+                    return cached[1]
+
+                # float32 is plenty for on-screen prices and halves the
+                # serialized size of every numeric column
+                bars = bars.astype({col: np.float32
+                                    for col in ('open', 'high', 'low', 'close')})
+
+                # Hand the traces raw ndarrays: plotly takes them
+                # zero-copy, where a Series pays a per-trace conversion
+                x_vals = bars.index.values
+                open_vals = bars['open'].to_numpy()
+                close_vals = bars['close'].to_numpy()
+
                 # Create professional candlestick chart
                 fig = go.Figure()
-                
+
                 # Add candlestick
                 fig.add_trace(go.Candlestick(
-                    x=bars.index,
-                    open=bars['open'],
-                    high=bars['high'],
-                    low=bars['low'],
-                    close=bars['close'],
+                    x=x_vals,
+                    open=open_vals,
+                    high=bars['high'].to_numpy(),
+                    low=bars['low'].to_numpy(),
+                    close=close_vals,
                     name=symbol,
                     increasing_line_color='#00ff88',
                     decreasing_line_color='#ff4444',
@@ -1468,63 +884,25 @@ class Dashboard:
                     decreasing_fillcolor='rgba(255, 68, 68, 0.3)'
                 ))
                 
-                # Add volume
+                # Add volume, tinted by bar direction — one vectorized
+                # np.where pass instead of a per-bar Python comprehension
+                volume_colors = np.where(
+                    close_vals >= open_vals,
+                    'rgba(0, 255, 136, 0.3)',
+                    'rgba(255, 68, 68, 0.3)'
+                )
                 fig.add_trace(go.Bar(
-                    x=bars.index,
-                    y=bars['volume'],
+                    x=x_vals,
+                    y=bars['volume'].to_numpy(),
                     name='Volume',
                     yaxis='y2',
-                    marker_color='rgba(0, 170, 255, 0.3)',
+                    marker_color=volume_colors,
                     showlegend=False
                 ))
                 
-                # Professional chart styling with improved responsive layout
-                fig.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='#ffffff', family='JetBrains Mono', size=11),
-                    xaxis=dict(
-                        gridcolor='rgba(255,255,255,0.08)',
-                        showgrid=True,
-                        zeroline=False,
-                        color='#cccccc',
-                        showticklabels=True,
-                        tickfont=dict(size=10),
-                        fixedrange=False  # Allow zooming
-                    ),
-                    yaxis=dict(
-                        title=dict(text="Price ($)", font=dict(size=11)),
-                        gridcolor='rgba(255,255,255,0.08)', 
-                        showgrid=True,
-                        zeroline=False,
-                        color='#cccccc',
-                        side='right',
-                        tickfont=dict(size=10),
-                        tickformat=',.2f',
-                        fixedrange=False  # Allow zooming
-                    ),
-                    yaxis2=dict(
-                        title=dict(text="Volume", font=dict(size=10)),
-                        overlaying='y',
-                        side='left',
-                        showgrid=False,
-                        color='#888888',
-                        tickfont=dict(size=9),
-                        showticklabels=True,
-                        fixedrange=False
-                    ),
-                    showlegend=False,
-                    margin=dict(l=60, r=60, t=10, b=30),  # Reduced margins for better space usage
-                    hovermode='x unified',
-                    hoverlabel=dict(
-                        bgcolor='rgba(42, 42, 42, 0.9)',
-                        bordercolor='rgba(255, 255, 255, 0.2)',
-                        font=dict(color='white', family='JetBrains Mono', size=10)
-                    ),
-                    autosize=True,  # Enable automatic sizing
-                    height=None,    # Let container control height
-                    dragmode='pan'  # Set default drag mode
-                )
+                # Professional chart styling — static, validated once
+                # at import as _MAIN_CHART_LAYOUT
+                fig.update_layout(_MAIN_CHART_LAYOUT)
                 
                 # Add LLM decision annotations (example)
                 fig.add_annotation(
@@ -1539,15 +917,16 @@ class Dashboard:
                     font=dict(color='#00ff88', size=10)
                 )
                 
+                self._chart_cache[symbol] = (chart_key, fig)
                 return fig
-                
+
             except Exception as e:
                 logger.error(f"Error updating main chart: {e}")
                 return self._create_empty_chart("Chart Error")
         
         @self.app.callback(
             Output('llm-tab-content', 'children'),
-            [Input('llm-interval', 'n_intervals'),
+            [Input('llm-trigger', 'data'),
              Input('llm-tabs', 'value'),
              Input('llm-time-range', 'value'),
              Input('llm-filter-type', 'value'),
@@ -1598,14 +977,9 @@ class Dashboard:
                         if symbol not in ['unknown', 'market'] and 'MARKET SCREENING' not in conv.get('prompt', ''):
                             filtered_conversations.append(conv)
                     elif filter_type == 'high_conf':
-                        try:
-                            if 'response' in conv:
-                                response_data = json.loads(conv['response'].replace('```json\n', '').replace('\n```', ''))
-                                confidence = response_data.get('confidence', 0)
-                                if confidence >= 75:
-                                    filtered_conversations.append(conv)
-                        except:
-                            pass
+                        response_data = conv.get('_parsed')
+                        if response_data and response_data.get('confidence', 0) >= 75:
+                            filtered_conversations.append(conv)
                 
                 conversations = filtered_conversations
                 
@@ -1634,30 +1008,27 @@ class Dashboard:
                     sentiments = {'BULLISH': 0, 'BEARISH': 0, 'NEUTRAL': 0}
                     
                     for conv in conversations:
-                        if 'response' in conv:
-                            try:
-                                response_data = json.loads(conv['response'].replace('```json\n', '').replace('\n```', ''))
-                                conf = response_data.get('confidence', 0)
-                                if conf > 0:
-                                    confidences.append(conf)
-                                
-                                decision = response_data.get('decision', '').upper()
-                                if decision in decisions:
-                                    decisions[decision] += 1
-                                
-                                sentiment = response_data.get('market_sentiment', '').upper()
-                                if sentiment in sentiments:
-                                    sentiments[sentiment] += 1
-                            except:
-                                pass
+                        response_data = conv.get('_parsed')
+                        if response_data:
+                            conf = response_data.get('confidence', 0)
+                            if conf > 0:
+                                confidences.append(conf)
+
+                            decision = response_data.get('decision', '').upper()
+                            if decision in decisions:
+                                decisions[decision] += 1
+
+                            sentiment = response_data.get('market_sentiment', '').upper()
+                            if sentiment in sentiments:
+                                sentiments[sentiment] += 1
                     
                     avg_confidence = sum(confidences) / len(confidences) if confidences else 0
                     
                     # Get time range
                     if conversations:
                         try:
-                            first_time = datetime.fromisoformat(conversations[0].get('timestamp', '').replace('Z', '+00:00'))
-                            last_time = datetime.fromisoformat(conversations[-1].get('timestamp', '').replace('Z', '+00:00'))
+                            first_time = conversations[0]['_dt']
+                            last_time = conversations[-1]['_dt']
                             time_span = last_time - first_time
                             hours = time_span.total_seconds() / 3600
                             time_range_str = f"{hours:.1f} hours" if hours < 24 else f"{hours/24:.1f} days"
@@ -1861,12 +1232,9 @@ class Dashboard:
                     thoughts = []
                     for conv in conversations[-5:]:  # Last 5 conversations
                         confidence = 75  # Default confidence
-                        if 'response' in conv:
-                            try:
-                                response_data = json.loads(conv['response'])
-                                confidence = response_data.get('confidence', 75)
-                            except:
-                                pass
+                        response_data = conv.get('_parsed')
+                        if response_data:
+                            confidence = response_data.get('confidence', 75)
                         
                         thought_text = f"💭 {conv.get('symbol', 'Market')}: "
                         if 'prompt' in conv and len(conv['prompt']) > 0:
@@ -1898,15 +1266,25 @@ class Dashboard:
                     return thoughts
                 
                 elif tab == 'formatted':
-                    # Show formatted conversation view
+                    # Show formatted conversation view — already bounded
+                    # to the newest _MAX_RENDERED_CONVERSATIONS by the
+                    # tail cache, so the DOM stays constant per refresh
                     conversation_items = []
                     
-                    # Helper function to get relative time
-                    def get_relative_time(timestamp_raw):
+                    # Helper function to get relative time. "Now" is
+                    # sampled once per refresh, not once per conversation
+                    now_naive = datetime.now()
+                    now_by_tz = {}
+
+                    def get_relative_time(dt):
                         try:
-                            if timestamp_raw:
-                                dt = datetime.fromisoformat(timestamp_raw.replace('Z', '+00:00'))
-                                now = datetime.now(dt.tzinfo) if dt.tzinfo else datetime.now()
+                            if dt is not None:
+                                if dt.tzinfo:
+                                    now = now_by_tz.get(dt.tzinfo)
+                                    if now is None:
+                                        now = now_by_tz[dt.tzinfo] = datetime.now(dt.tzinfo)
+                                else:
+                                    now = now_naive
                                 diff = now - dt
                                 
                                 seconds = diff.total_seconds()
@@ -1928,9 +1306,8 @@ class Dashboard:
                         return "N/A", "N/A", ""
                     
                     for conv in conversations:
-                        # Parse timestamp to readable format
-                        timestamp_raw = conv.get('timestamp', '')
-                        relative_time, absolute_time, date_str = get_relative_time(timestamp_raw)
+                        # Datetime was parsed once at ingestion
+                        relative_time, absolute_time, date_str = get_relative_time(conv.get('_dt'))
                         
                         symbol = conv.get('symbol', 'Market')
                         
@@ -1944,30 +1321,25 @@ class Dashboard:
                         regime = None
                         recommendations = []
                         
-                        if 'response' in conv:
-                            try:
-                                # Try to parse as market intelligence first
-                                response_data = json.loads(conv['response'].replace('```json\n', '').replace('\n```', ''))
-                                
-                                if 'market_sentiment' in response_data:
-                                    # This is market intelligence
-                                    sentiment = response_data.get('market_sentiment', 'neutral').upper()
-                                    confidence = response_data.get('confidence', 75)
-                                    regime = response_data.get('regime_assessment', '').replace('_', ' ').title()
-                                    recommendations = response_data.get('recommended_actions', [])
-                                    decision = f"{sentiment} Market"
-                                else:
-                                    # Regular stock trading decision
-                                    decision = response_data.get('decision', 'hold').upper()
-                                    confidence = response_data.get('confidence', 75)
-                            except:
-                                pass
+                        response_data = conv.get('_parsed')
+                        if response_data:
+                            if 'market_sentiment' in response_data:
+                                # This is market intelligence
+                                sentiment = response_data.get('market_sentiment', 'neutral').upper()
+                                confidence = response_data.get('confidence', 75)
+                                regime = response_data.get('regime_assessment', '').replace('_', ' ').title()
+                                recommendations = response_data.get('recommended_actions', [])
+                                decision = f"{sentiment} Market"
+                            else:
+                                # Regular stock trading decision
+                                decision = response_data.get('decision', 'hold').upper()
+                                confidence = response_data.get('confidence', 75)
                         
                         # Color based on decision/sentiment
                         if sentiment:
-                            decision_color = "#00ff88" if sentiment == "BULLISH" else "#ff4444" if sentiment == "BEARISH" else "#00aaff"
+                            decision_color = _SENTIMENT_COLOR.get(sentiment, _NEUTRAL_COLOR)
                         else:
-                            decision_color = "#00ff88" if decision == "BUY" else "#ff4444" if decision == "SELL" else "#00aaff"
+                            decision_color = _DECISION_COLOR.get(decision, _NEUTRAL_COLOR)
                         
                         # Display actual prompt content (technical data)
                         prompt_display = None
@@ -2183,96 +1555,80 @@ class Dashboard:
                 logger.error(f"Error updating market screener: {e}")
                 return [html.Div("🔧 Screener error", className="metric-card")]
         
-        @self.app.callback(
-            [Output('performance-metrics', 'children'),
-             Output('positions-panel', 'children')],
-            [Input('main-interval', 'n_intervals')]
-        )
         def update_bottom_panels(n):
             """Update performance and positions panels"""
             try:
-                # Performance Metrics
-                account = self.alpaca.get_account()
-                
-                # Handle both dict and object responses
-                if isinstance(account, dict):
-                    equity = float(account.get('equity', 100000))
-                    last_equity = float(account.get('last_equity', equity))
-                    buying_power = float(account.get('buying_power', 0))
-                else:
-                    equity = float(account.equity)
-                    last_equity = float(account.last_equity)
-                    buying_power = float(account.buying_power)
-                
+                # Performance Metrics from the shared per-tick snapshot
+                tick_data = self._get_tick_data(n)
+                account = tick_data['account']
+
+                # The client always returns a dict with float-coerced
+                # numerics ({} on error), so no type dispatch is needed
+                equity = account.get('equity', 100000.0)
+                last_equity = account.get('last_equity', equity)
+                buying_power = account.get('buying_power', 0.0)
+
+                # Nothing moved since the last build: return the cached
+                # children instead of rebuilding them. Returning the real
+                # children (not no_update) keeps fresh page loads correct —
+                # ctx.triggered is non-empty here even on initial load
+                # because main-trigger is written by the clientside router
+                snapshot_hash = hash((
+                    equity, last_equity, buying_power,
+                    tuple((pos.get('symbol'), pos.get('qty'), pos.get('unrealized_pl'))
+                          for pos in tick_data['positions'][:5])
+                ))
+                cached = self._last_hashes.get('bottom')
+                if cached is not None and cached[0] == snapshot_hash:
+                    return cached[1], cached[2]
+
                 pnl = equity - last_equity
                 
                 # Compact performance layout
                 performance = [
                     html.Div([
-                        html.Div([
-                            html.Div("Portfolio", className="compact-label"),
-                            html.Div(f"${equity:,.0f}", className="compact-value neutral")
-                        ], className="compact-metric"),
-                        html.Div([
-                            html.Div("P&L Today", className="compact-label"),
-                            html.Div(f"${pnl:+,.0f}", className=f"compact-value {'positive' if pnl >= 0 else 'negative'}")
-                        ], className="compact-metric")
+                        _compact_metric("Portfolio", _fmt_money(equity)),
+                        _compact_metric("P&L Today", _fmt_signed_money(pnl), _PNL_CLASS[pnl >= 0])
                     ], className="compact-grid"),
-                    
+
                     html.Div([
-                        html.Div([
-                            html.Div("Buying Power", className="compact-label"),
-                            html.Div(f"${buying_power:,.0f}", className="compact-value neutral")
-                        ], className="compact-metric"),
-                        html.Div([
-                            html.Div("Cash Avail", className="compact-label"),
-                            html.Div(f"${buying_power*0.25:,.0f}", className="compact-value neutral")  # Rough estimate
-                        ], className="compact-metric")
+                        _compact_metric("Buying Power", _fmt_money(buying_power)),
+                        _compact_metric("Cash Avail", _fmt_money(buying_power * 0.25))  # Rough estimate
                     ], className="compact-grid")
                 ]
                 
                 # Positions
                 try:
-                    positions = self.alpaca.get_positions()
+                    positions = tick_data['positions']
                     position_cards = []
                     
                     if positions and len(positions) > 0:
-                        for pos in positions[:5]:  # Top 5 positions
-                            # Handle both dict and object responses
-                            if isinstance(pos, dict):
-                                symbol = pos.get('symbol', 'UNKNOWN')
-                                qty = pos.get('qty', 0)
-                                pnl = float(pos.get('unrealized_pl', 0))
-                            else:
-                                symbol = pos.symbol
-                                qty = pos.qty
-                                pnl = float(pos.unrealized_pl)
-                                
-                            pnl_color = "positive" if pnl >= 0 else "negative"
-                            
+                        # get_positions() always yields normalized dicts,
+                        # so the rows come straight out without dispatch
+                        rows = [(pos.get('symbol', 'UNKNOWN'), pos.get('qty', 0),
+                                 pos.get('unrealized_pl', 0.0))
+                                for pos in positions[:5]]
+
+                        for symbol, qty, pnl in rows:  # Top 5 positions
+                            pnl_class = _PNL_CLASS[pnl >= 0]
+
                             position_cards.append(
                                 html.Div([
                                     html.Div([
-                                        html.Span(symbol, style={"fontWeight": "bold", "fontSize": "12px", "color": "var(--accent-blue)"}),
-                                        html.Span(f" {qty}", style={"fontSize": "10px", "color": "var(--text-muted)", "marginLeft": "6px"})
-                                    ], style={"display": "flex", "justifyContent": "space-between", "alignItems": "center"}),
-                                    html.Div(f"${pnl:+,.0f}", className=f"compact-value {pnl_color}", style={"fontSize": "11px", "textAlign": "right"})
-                                ], style={"background": "var(--bg-secondary)", "border": "1px solid var(--border-color)", "borderRadius": "4px", "padding": "6px 8px", "margin": "3px 0"})
+                                        html.Span(symbol, style=_POS_SYMBOL_STYLE),
+                                        html.Span(f" {qty}", style=_POS_QTY_STYLE)
+                                    ], style=_POS_HEADER_STYLE),
+                                    html.Div(_fmt_signed_money(pnl), className=pnl_class, style=_POS_PNL_STYLE)
+                                ], style=_POS_CARD_STYLE)
                             )
                     else:
-                        position_cards = [
-                            html.Div([
-                                html.Div("No active positions", style={"fontSize": "11px", "color": "var(--text-muted)", "textAlign": "center", "padding": "12px"})
-                            ], style={"background": "var(--bg-secondary)", "border": "1px solid var(--border-color)", "borderRadius": "4px"})
-                        ]
+                        position_cards = self._no_positions_cards
                 except Exception as pos_error:
                     logger.warning(f"Error getting positions: {pos_error}")
-                    position_cards = [
-                        html.Div([
-                            html.Div("Positions unavailable", style={"fontSize": "11px", "color": "var(--accent-red)", "textAlign": "center", "padding": "12px"})
-                        ], style={"background": "var(--bg-secondary)", "border": "1px solid var(--border-color)", "borderRadius": "4px"})
-                    ]
-                
+                    position_cards = self._positions_unavailable_cards
+
+                self._last_hashes['bottom'] = (snapshot_hash, performance,
+                                               position_cards)
                 return performance, position_cards
                 
             except Exception as e:
@@ -2281,9 +1637,118 @@ class Dashboard:
                     [html.Div("Error loading performance", className="metric-card")],
                     [html.Div("Error loading positions", className="metric-card")]
                 )
-    
+
+        @self.app.callback(
+            [Output('market-status', 'children'),
+             Output('market-status', 'style'),
+             Output('market-state', 'children'),
+             Output('market-state', 'style'),
+             Output('account-store', 'data'),
+             Output('main-chart', 'figure'),
+             Output('performance-metrics', 'children'),
+             Output('positions-panel', 'children')],
+            [Input('main-trigger', 'data')]
+        )
+        def update_main_tick(n):
+            """One request per main tick: header, chart and panels together"""
+            header = update_header_status(n)
+
+            # Off-hours, only the cheap header badges keep refreshing
+            if self._throttled_while_closed(n):
+                return (*header, no_update, no_update, no_update)
+
+            performance, position_cards = update_bottom_panels(n)
+            return (*header, update_main_chart(n), performance, position_cards)
+
+    def _refresh_loop(self):
+        """
+        Keep the shared tick snapshot warm from a background thread.
+
+        Callbacks read the snapshot through _get_tick_data; with this
+        loop rewarming it ahead of the TTL, the UI refresh rate is
+        decoupled from Alpaca's round-trip latency — request threads
+        never sit on the network during a tick.
+        """
+        while True:
+            try:
+                self._get_tick_data(force=True)
+            except Exception as e:
+                logger.debug(f"Background snapshot refresh failed: {e}")
+            time.sleep(2.0)
+
+    def _throttled_while_closed(self, n) -> bool:
+        """
+        True when this tick should be skipped because the market is closed.
+
+        Off-hours nothing on the chart or in the account moves, so the
+        heavy callbacks drop to one refresh every 6th tick (~30s at the
+        5s main interval) instead of hammering the API all night.
+        """
+        try:
+            market_status = self._get_tick_data(n)['market_status']
+            return not market_status.get('is_open', True) and n % 6 != 0
+        except Exception:
+            return False
+
+    def _get_bars_cached(self, symbol: str, limit: int, timeframe: str):
+        """
+        Get bars through a short-lived TTL cache.
+
+        Eliminates the redundant REST call on every chart tick — the
+        cached frame is reused until the TTL lapses, then refreshed.
+        """
+        key = (symbol, timeframe, limit)
+        cached = self._bars_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._bars_cache_ttl:
+            self._bars_cache.move_to_end(key)
+            return cached[1]
+
+        bars = self.alpaca.get_bars(symbol, limit=limit, timeframe=timeframe)
+        if not bars.empty:
+            self._bars_cache[key] = (time.monotonic(), bars)
+            self._bars_cache.move_to_end(key)
+            while len(self._bars_cache) > self._bars_cache_max:
+                self._bars_cache.popitem(last=False)
+        return bars
+
+    def _get_tick_data(self, n=None, force=False):
+        """
+        Get the shared Alpaca data snapshot for the current tick.
+
+        The account, positions and market-status calls are issued
+        concurrently on the executor, so one fetch costs the slowest
+        round-trip instead of the sum of all three. The result is cached
+        with a short TTL keyed on the wall clock rather than the interval
+        counter — browser tabs start their counters at different times,
+        so a time key lets every tab (and every callback within a tick)
+        share one fetch. The fetch itself runs outside the lock so a
+        TTL-valid snapshot stays readable while the background loop is
+        on the network; the fresh dict is built first and only the swap
+        happens under the lock.
+        """
+        fetched_at, data = self._tick_cache
+        if (not force and data is not None
+                and time.monotonic() - fetched_at < self._tick_cache_ttl):
+            return data
+
+        account_future = self._tick_executor.submit(self.alpaca.get_account)
+        positions_future = self._tick_executor.submit(self.alpaca.get_positions)
+        status_future = self._tick_executor.submit(self.alpaca.get_market_status)
+
+        data = {
+            'account': account_future.result(),
+            'positions': positions_future.result(),
+            'market_status': status_future.result()
+        }
+        with self._tick_lock:
+            self._tick_cache = (time.monotonic(), data)
+        return data
+
     def _create_empty_chart(self, message: str):
-        """Create empty chart with message"""
+        """Create empty chart with message (memoized — there are only a few)"""
+        fig = self._empty_chart_cache.get(message)
+        if fig is not None:
+            return fig
         fig = go.Figure()
         fig.add_annotation(
             x=0.5, y=0.5,
@@ -2292,37 +1757,76 @@ class Dashboard:
             showarrow=False,
             font=dict(size=16, color="#888888")
         )
-        fig.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=False, showticklabels=False),
-            yaxis=dict(showgrid=False, showticklabels=False),
-            margin=dict(l=0, r=0, t=0, b=0)
-        )
+        fig.update_layout(_EMPTY_CHART_LAYOUT)
+        self._empty_chart_cache[message] = fig
         return fig
     
     def _get_llm_conversations(self):
-        """Get LLM conversations from log file with better time management"""
+        """
+        Get recent LLM conversations, tail-reading the log incrementally.
+
+        Instead of re-reading and re-parsing the whole JSONL on every
+        2s tick, the reader remembers its byte offset and only parses
+        lines appended since the previous call — O(new data) per tick
+        no matter how large the log grows. Truncation or rotation
+        (file smaller than the remembered offset) resets the tail.
+        """
         try:
             log_file = Path("logs/llm_conversations.jsonl")
-            conversations = []
-            
-            if log_file.exists():
-                with open(log_file, 'r') as f:
-                    for line in f:
+
+            # Offset, partial buffer and cache are shared across request
+            # threads — serialize the read-and-append so two concurrent
+            # ticks can't consume the same byte range twice
+            with self._conv_lock:
+                if not log_file.exists():
+                    return list(self._conv_cache)
+
+                if log_file.stat().st_size < self._conv_offset:
+                    self._conv_cache.clear()
+                    self._conv_offset = 0
+                    self._conv_partial = b''
+
+                with open(log_file, 'rb') as f:
+                    f.seek(self._conv_offset)
+                    chunk = f.read()
+                    self._conv_offset = f.tell()
+
+                if chunk:
+                    lines = (self._conv_partial + chunk).split(b'\n')
+                    # A trailing half-written record waits for the next read
+                    self._conv_partial = lines.pop()
+                    for line in lines:
+                        if not line.strip():
+                            continue
                         try:
-                            conv = json.loads(line)
+                            conv = _loads(line)
                             # Add timestamp if missing
                             if 'timestamp' not in conv:
                                 conv['timestamp'] = datetime.now().isoformat()
-                            conversations.append(conv)
+                            # Parse the timestamp once here too — the
+                            # rendered views re-derive display times every
+                            # refresh, but the datetime itself never changes
+                            try:
+                                conv['_dt'] = datetime.fromisoformat(
+                                    conv['timestamp'].replace('Z', '+00:00'))
+                            except Exception:
+                                conv['_dt'] = None
+                            # Parse the response payload once here; every
+                            # downstream consumer reads '_parsed' instead of
+                            # re-parsing the same string each tick
+                            response = conv.get('response')
+                            if response:
+                                try:
+                                    conv['_parsed'] = _loads(
+                                        response.replace('```json\n', '').replace('\n```', ''))
+                                except Exception:
+                                    conv['_parsed'] = None
+                            self._conv_cache.append(conv)
                         except:
                             continue
-            
-            # Return more conversations for better filtering
-            # Get last 100 conversations (or all if less than 100)
-            return conversations[-100:] if len(conversations) > 100 else conversations
-            
+
+                return list(self._conv_cache)
+
         except Exception as e:
             logger.error(f"Error reading conversations: {e}")
             return []
@@ -2682,20 +2186,8 @@ Guidelines:
         """Get latest market intelligence data"""
         try:
             # Try to get from database or file
-            # For now, return mock data
-            return {
-                "market_sentiment": "bullish",
-                "confidence": 75,
-                "opportunities": [
-                    "AAPL showing strong momentum",
-                    "Tech sector outperforming",
-                    "Low volatility environment"
-                ],
-                "risks": [
-                    "High market concentration",
-                    "Earnings season approaching"
-                ]
-            }
+            # For now, return mock data (built once at module load)
+            return _MOCK_INTEL
         except Exception as e:
             logger.error(f"Error getting market intelligence: {e}")
             return None
@@ -2708,8 +2200,26 @@ Guidelines:
         logger.info("🤖 Real-time AI decision monitoring")
         logger.info("")
         logger.info("Press Ctrl+C to stop")
-        
-        # Use modern Dash API (v2.0+) - run_server is obsolete in Dash 3.x
-        self.app.run(host=host, port=port, debug=debug)
+
+        # Rewarm the shared Alpaca snapshot from a daemon thread so
+        # request threads read memory instead of blocking on the API
+        threading.Thread(target=self._refresh_loop, name="tick-refresh",
+                         daemon=True).start()
+
+
+        if debug:
+            # Use modern Dash API (v2.0+) - run_server is obsolete in Dash 3.x
+            self.app.run(host=host, port=port, debug=True)
+            return
+
+        # Werkzeug's dev server serialises requests; prefer a threaded
+        # production WSGI server so chart and panel callbacks don't block
+        # each other
+        try:
+            from waitress import serve
+            serve(self.app.server, host=host, port=port, threads=8)
+        except ImportError:
+            logger.warning("waitress not installed, falling back to Flask dev server")
+            self.app.run(host=host, port=port, debug=False)
 
 
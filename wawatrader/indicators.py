@@ -407,8 +407,11 @@ class TechnicalIndicators:
         # RSI
         df['rsi'] = TechnicalIndicators.rsi(df['close'], 14)
         
-        # MACD
-        macd_line, signal_line, histogram = TechnicalIndicators.macd(df['close'])
+        # MACD — derived from the 12/26 EMAs computed above rather than
+        # recomputing both inside macd(), which would double the EMA work
+        macd_line = df['ema_12'] - df['ema_26']
+        signal_line = TechnicalIndicators.ema(macd_line, 9)
+        histogram = macd_line - signal_line
         df['macd'] = macd_line
         df['macd_signal'] = signal_line
         df['macd_histogram'] = histogram
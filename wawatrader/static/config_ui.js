@@ -0,0 +1,203 @@
+let currentConfig = {};
+
+// Flat id -> element map built once at startup, so populate/save
+// never repeat getElementById per key
+const FORM_ELS = new Map();
+function indexFormElements() {
+    document.querySelectorAll('input[id*="."], select[id*="."], textarea[id*="."]')
+        .forEach(el => FORM_ELS.set(el.id, el));
+}
+
+// Static form schema fetched once per session, grouped by category
+const SCHEMA_BY_CATEGORY = new Map();
+async function loadSchema() {
+    const response = await fetch('/api/schema');
+    for (const field of await response.json()) {
+        if (!SCHEMA_BY_CATEGORY.has(field.category)) {
+            SCHEMA_BY_CATEGORY.set(field.category, []);
+        }
+        SCHEMA_BY_CATEGORY.get(field.category).push(field);
+    }
+}
+
+// Track the active tab/content so switching only touches the two
+// elements that change, not every tab on every click
+let activeTab = null;
+let activeContent = null;
+
+// Switch between tabs
+function switchTab(tabName, button) {
+    activeTab?.classList.remove('active');
+    button.classList.add('active');
+    activeTab = button;
+
+    activeContent?.classList.remove('active');
+    const content = document.getElementById(tabName + '-tab');
+    content.classList.add('active');
+    activeContent = content;
+
+    // Load history if history tab
+    if (tabName === 'history') {
+        loadHistory();
+    }
+}
+
+// Load configuration from server. The last payload is kept in memory
+// with its ETag, so repeat loads (e.g. Reset) revalidate with
+// If-None-Match and reuse the cached copy on a 304
+let configEtag = null;
+async function loadConfig() {
+    try {
+        const headers = configEtag ? { 'If-None-Match': configEtag } : {};
+        const response = await fetch('/api/config', { headers });
+        if (response.status !== 304) {
+            configEtag = response.headers.get('ETag');
+            currentConfig = await response.json();
+        }
+        populateForm();
+    } catch (error) {
+        showAlert('Failed to load configuration', 'error');
+    }
+}
+
+// Populate form with config values
+function populateForm() {
+    for (const [fullKey, element] of FORM_ELS) {
+        const dot = fullKey.indexOf('.');
+        const value = currentConfig[fullKey.slice(0, dot)]?.[fullKey.slice(dot + 1)];
+
+        if (value === undefined) continue;
+
+        if (element.type === 'checkbox') {
+            element.checked = value;
+        } else if (fullKey === 'trading.symbols') {
+            element.value = Array.isArray(value) ? value.join(', ') : value;
+        } else {
+            element.value = value;
+        }
+    }
+}
+
+// Save category configuration
+async function saveCategory(category) {
+    const updates = {};
+    const categoryConfig = currentConfig[category] || {};
+
+    // Drive extraction off the static schema: no per-key DOM
+    // property reads to decide the value type
+    for (const field of SCHEMA_BY_CATEGORY.get(category) || []) {
+        const element = FORM_ELS.get(field.key);
+        if (!element) continue;
+
+        let value;
+        if (field.type === 'bool') {
+            value = element.checked;
+        } else if (field.type === 'number') {
+            value = parseFloat(element.value);
+        } else if (field.type === 'list') {
+            value = element.value.split(',').map(s => s.trim()).filter(s => s);
+        } else {
+            value = element.value;
+        }
+
+        updates[field.key] = value;
+    }
+    
+    try {
+        const response = await fetch('/api/config', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(updates)
+        });
+        
+        const result = await response.json();
+
+        if (result.success) {
+            showAlert(`${category.charAt(0).toUpperCase() + category.slice(1)} settings saved successfully!`, 'success');
+            // Merge the saved values into the local copy — the form
+            // already shows them, so skip the refetch + repopulate
+            // (the Reset button still does a full loadConfig)
+            for (const [fullKey, value] of Object.entries(updates)) {
+                categoryConfig[fullKey.slice(category.length + 1)] = value;
+            }
+        } else {
+            showAlert(result.message || 'Failed to save configuration', 'error');
+        }
+    } catch (error) {
+        showAlert('Failed to save configuration: ' + error.message, 'error');
+    }
+}
+
+// One shared formatter — toLocaleString builds fresh ICU state per call
+const DATE_FMT = new Intl.DateTimeFormat(undefined, {dateStyle: 'short', timeStyle: 'medium'});
+
+// Escape text destined for innerHTML
+function escapeHtml(text) {
+    return String(text)
+        .replace(/&/g, '&amp;')
+        .replace(/</g, '&lt;')
+        .replace(/>/g, '&gt;')
+        .replace(/"/g, '&quot;');
+}
+
+// Markup for a single history row
+function historyRowHTML(entry) {
+    return `
+        <td>${DATE_FMT.format(new Date(entry.changed_at))}</td>
+        <td><strong>${escapeHtml(entry.key)}</strong></td>
+        <td>${escapeHtml(entry.old_value_str)}</td>
+        <td>${escapeHtml(entry.new_value_str)}</td>
+        <td>${escapeHtml(entry.changed_by)}</td>
+    `;
+}
+
+// Load configuration history
+async function loadHistory() {
+    try {
+        const response = await fetch('/api/history?limit=200');
+        const history = await response.json();
+
+        const tbody = document.getElementById('history-body');
+
+        if (history.length === 0) {
+            tbody.innerHTML = '<tr><td colspan="5" style="text-align:center;">No history yet</td></tr>';
+            return;
+        }
+
+        // Assemble rows off-DOM in a fragment, then swap the whole body
+        // with one replaceChildren call — a single insertion and reflow
+        const fragment = document.createDocumentFragment();
+        for (const entry of history) {
+            const row = document.createElement('tr');
+            row.innerHTML = historyRowHTML(entry);
+            fragment.appendChild(row);
+        }
+        tbody.replaceChildren(fragment);
+    } catch (error) {
+        showAlert('Failed to load history', 'error');
+    }
+}
+
+// Show alert message
+function showAlert(message, type) {
+    const container = document.getElementById('alert-container');
+    const alert = document.createElement('div');
+    alert.className = `alert ${type}`;
+    alert.textContent = message;
+    alert.style.display = 'block';
+    
+    container.innerHTML = '';
+    container.appendChild(alert);
+    
+    // Auto-hide after 5 seconds
+    setTimeout(() => {
+        alert.style.display = 'none';
+    }, 5000);
+}
+
+// Index form elements, then load schema + config on page load
+window.addEventListener('DOMContentLoaded', () => {
+    indexFormElements();
+    loadSchema();
+    loadConfig();
+});